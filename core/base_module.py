@@ -9,7 +9,28 @@ Jedes Modul (A, B, C, D) erbt von AnalyseModul und implementiert:
 
 import re
 from abc import ABC, abstractmethod
-from .datamodel import Annotation
+from bisect import bisect_left
+from datetime import datetime
+from .datamodel import AnnKind, Annotation
+
+# Optionale lineare Regex-Engine (DFA statt Backtracking).
+# google-re2 ist drop-in-kompatibel für die hier genutzten Features;
+# graceful degradation wie bei spacy/nltk in core/language.py.
+# Hyperscan wurde als weiteres Backend geprüft und verworfen: es
+# meldet ALLE überlappenden Treffer statt nicht-überlappendem
+# finditer pro Muster — die Markerzählung wäre nicht mehr vergleichbar.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Optionaler Aho-Corasick-Automat als Literal-Vorfilter: ein linearer
+# Sweep über den Text sagt, ob eine rein literale Musterliste überhaupt
+# Kandidaten hat, bevor die Regex-Suche startet (pyahocorasick).
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
 
 
 class AnalyseModul(ABC):
@@ -35,15 +56,28 @@ class AnalyseModul(ABC):
         self.name = name
         self.gate = language_gate
         self.framebook = framebook_section
+        # Compiled-Pattern-Cache: (pattern, flags) → re.Pattern.
+        # Vermeidet wiederholte Kompilierung/Cache-Lookups im Hot Path.
+        self._compiled_cache = {}
+        # Literal-Vorfilter pro Musterliste: patterns-Tupel → Automaton
+        # oder None, wenn die Liste nicht rein literal ist.
+        self._automaton_cache = {}
     
     @abstractmethod
     def analyse(self, document):
         """
         Führt die Analyse durch und schreibt Annotations ins Document.
-        
+
+        Die Turn-Schleifen laufen bewusst sequenziell: Interviews haben
+        typischerweise Dutzende Turns (Prozess-Pool-Setup und das
+        Pickling der kompilierten Muster kosten mehr, als sie sparen),
+        und die Annotations-Reihenfolge im Dokument ist Teil des
+        Audit Trails. Parallelisierung gehört, wenn überhaupt, auf die
+        Corpus-Ebene (ein Dokument pro Worker).
+
         Args:
             document: Document-Objekt
-        
+
         Returns:
             Anzahl der erzeugten Annotations
         """
@@ -66,29 +100,25 @@ class AnalyseModul(ABC):
         Das sind die Stellen, die du zuerst im Original lesen solltest.
         """
         anns = document.get_annotations(modul=self.modul_id)
-        
-        # Gruppieren nach Turn
-        turn_counts = {}
-        turn_texts = {}
+
+        # Gruppieren nach Turn (ein Durchlauf statt O(T·A)-Scans)
+        anns_by_turn = {}
         for a in anns:
-            tid = a.turn_id
-            turn_counts[tid] = turn_counts.get(tid, 0) + 1
-            if tid not in turn_texts:
-                for t in document.turns:
-                    if t.turn_id == tid:
-                        turn_texts[tid] = t.text
-                        break
-        
+            anns_by_turn.setdefault(a.turn_id, []).append(a)
+
         # Nach Dichte sortieren (Annotations pro 100 Wörter)
         ranked = []
-        for tid, count in turn_counts.items():
-            text = turn_texts.get(tid, "")
-            n_woerter = max(len(text.split()), 1)
+        for tid, turn_anns in anns_by_turn.items():
+            turn = document.get_turn(tid)
+            text = turn.text if turn else ""
+            count = len(turn_anns)
+            # Gecachte Wortzahl vom Turn statt erneutem text.split()
+            n_woerter = max(turn.n_woerter if turn else 0, 1)
             dichte = (count / n_woerter) * 100
-            
+
             # Welche Kategorien wurden geflaggt?
-            kategorien = set(a.kategorie for a in anns if a.turn_id == tid)
-            
+            kategorien = set(a.kategorie for a in turn_anns)
+
             ranked.append({
                 'turn_id': tid,
                 'n_annotations': count,
@@ -101,7 +131,33 @@ class AnalyseModul(ABC):
         return ranked[:n]
     
     # ---- Hilfsmethoden für alle Module ----
-    
+
+    def _compile(self, pattern, flags=re.IGNORECASE):
+        """
+        Kompiliert ein Muster einmalig und cached es.
+
+        Nutzt re2 (lineare Laufzeit, kein katastrophales Backtracking),
+        wenn installiert; fällt bei re2-inkompatiblen Features
+        (z.B. Lookbehind) pro Muster auf `re` zurück.
+
+        Default ist IGNORECASE auf dem Originaltext — kein text.lower()
+        im Suchpfad. Die Framebook-Muster sind literale Alternationen
+        ohne unbegrenzte .*/.+-Präfixe; sollte das Framebook je welche
+        bekommen, gehören sie auf .{0,80}? begrenzt.
+        """
+        key = (pattern, flags)
+        compiled = self._compiled_cache.get(key)
+        if compiled is None:
+            if _re2 is not None:
+                try:
+                    compiled = _re2.compile(pattern, flags)
+                except Exception:
+                    compiled = re.compile(pattern, flags)
+            else:
+                compiled = re.compile(pattern, flags)
+            self._compiled_cache[key] = compiled
+        return compiled
+
     def _pattern_search(
         self,
         text,
@@ -111,65 +167,140 @@ class AnalyseModul(ABC):
         satz="",
         regel_prefix="",
         flags=re.IGNORECASE,
+        kind=AnnKind.FRAME,
     ):
         """
         Durchsucht Text mit Regex-Mustern und erzeugt Annotations.
-        
+
         Zentrale Methode: Jeder Treffer wird als Annotation mit
         vollständigem Audit Trail gespeichert.
-        
-        Returns:
-            Liste von Annotation-Objekten
+
+        `flags` werden beim Kompilieren in das gecachte Pattern gebacken
+        (Teil des Cache-Keys); die Suche selbst läuft flag-los über
+        compiled.finditer(text).
+
+        Yields:
+            Annotation-Objekte (Generator — kein Zwischenpuffer;
+            Aufrufer können direkt in document.add_annotations streamen)
         """
-        annotations = []
-        
-        for i, pattern in enumerate(patterns):
-            regel_id = f"{regel_prefix}_{i:02d}" if regel_prefix else f"{self.modul_id}_{kategorie}_{i:02d}"
-            
+        # Literal-Vorfilter: meldet der Automat keinen Treffer, kann
+        # auch die Regex-Alternation keinen haben → Lauf entfällt ganz.
+        automat = self._literal_automaton(patterns)
+        if automat is not None and next(automat.iter(text.lower()), None) is None:
+            return
+
+        # Regel-IDs einmal pro Aufruf bauen statt f-String pro Treffer
+        prefix = regel_prefix or f"{self.modul_id}_{kategorie}"
+        regel_ids = [f"{prefix}_{i:02d}" for i in range(len(patterns))]
+
+        # Satzgrenzen einmal pro Text bestimmen statt 4 Scans pro Treffer
+        grenzen = None if satz else self._satz_grenzen(text)
+
+        # Lokale Bindings für den Hot Loop (spart Attribut-Lookups pro Treffer)
+        modul_id = self.modul_id
+        find_satz = self._find_containing_sentence
+
+        # Ein Zeitstempel pro Suchlauf statt datetime.now() pro Annotation;
+        # alle Treffer eines Laufs gehören ohnehin zum selben Analyse-Schritt.
+        zeitstempel = datetime.now().isoformat()
+
+        def mach_annotation(i, match):
             # Case-insensitive matching by default (do NOT lowercase the text),
             # so that matched spans preserve original casing for auditability.
-            for match in re.finditer(pattern, text, flags):
-                matched_text = match.group(0)
-                
-                ann = Annotation(
-                    modul=self.modul_id,
-                    kategorie=kategorie,
-                    regel_id=regel_id,
-                    pattern=pattern,
-                    matched_text=matched_text,
-                    matched_start=match.start(),
-                    matched_end=match.end(),
-                    satz=satz if satz else self._find_containing_sentence(text, match.start()),
-                    turn_id=turn_id,
-                    confidence="pattern",
-                )
-                annotations.append(ann)
-        
-        return annotations
+            # Matching gegen eine lowercased Kopie wäre zudem Offset-unsicher:
+            # str.lower() ist nicht längenerhaltend (z.B. 'İ' → 'i̇'), die
+            # matched_start/-end-Spannen zeigten dann neben den Originaltext.
+            return Annotation(
+                modul=modul_id,
+                kategorie=kategorie,
+                regel_id=regel_ids[i],
+                pattern=patterns[i],
+                matched_text=match.group(0),
+                matched_start=match.start(),
+                matched_end=match.end(),
+                satz=satz if satz else find_satz(text, match.start(), grenzen),
+                turn_id=turn_id,
+                confidence="pattern",
+                timestamp=zeitstempel,
+                kind=kind,
+            )
+
+        # Ein finditer-Lauf pro Muster. Eine kombinierte Alternation
+        # (p0|p1|...) wäre nur ein Scan, liefert aber nur
+        # nicht-überlappende Treffer: ein Marker innerhalb des Treffers
+        # eines ANDEREN Musters ginge verloren, und die Markerzahlen
+        # (Dichten, Scores) wären nicht mehr mit der Einzelsuche
+        # vergleichbar.
+        for i, pattern in enumerate(patterns):
+            compiled = self._compile(pattern, flags)
+            for match in compiled.finditer(text):
+                yield mach_annotation(i, match)
     
-    def _find_containing_sentence(self, text, position):
+    # Regex-Metazeichen → Muster ist NICHT rein literal zerlegbar
+    _NICHT_LITERAL = re.compile(r'[.\\*+?()\[\]{}^$]')
+
+    def _literal_automaton(self, patterns):
+        """
+        Baut (und cached) einen Aho-Corasick-Automaten über die
+        Literal-Alternativen einer Musterliste.
+
+        Nur wenn JEDES Muster in reine Literale zerfällt (höchstens eine
+        äußere Gruppe, nur |-Alternativen ohne Metazeichen), ist ein
+        fehlender Automat-Treffer ein sicherer Beweis für null
+        Regex-Treffer → dann darf die Suche übersprungen werden.
+        Sonst (oder ohne pyahocorasick): None.
+        """
+        if _ahocorasick is None:
+            return None
+        key = tuple(patterns)
+        if key in self._automaton_cache:
+            return self._automaton_cache[key]
+
+        automat = None
+        literale = []
+        for p in patterns:
+            body = p[1:-1] if p.startswith('(') and p.endswith(')') else p
+            if self._NICHT_LITERAL.search(body):
+                literale = None
+                break
+            literale.extend(alt for alt in body.lower().split('|') if alt)
+        if literale:
+            automat = _ahocorasick.Automaton()
+            for lit in literale:
+                automat.add_word(lit, lit)
+            automat.make_automaton()
+
+        self._automaton_cache[key] = automat
+        return automat
+
+    _SATZGRENZEN = re.compile(r'[.!?\n]')
+
+    def _satz_grenzen(self, text):
+        """Positionen aller Satzgrenzen (. ! ? und Zeilenumbrüche), sortiert."""
+        return [m.start() for m in self._SATZGRENZEN.finditer(text)]
+
+    def _find_containing_sentence(self, text, position, grenzen=None):
         """Findet den Satz, der die Position enthält (robust für . ! ? und Zeilenumbrüche)."""
-        # Boundaries: punctuation or newline
-        left = text.rfind('\n', 0, position)
-        for p in ('.', '!', '?'):
-            left = max(left, text.rfind(p, 0, position))
-        start = left + 1 if left >= 0 else 0
-
-        # Find nearest right boundary
-        right_candidates = [
-            i for i in (
-                text.find('.', position),
-                text.find('!', position),
-                text.find('?', position),
-                text.find('\n', position),
-            )
-            if i != -1
-        ]
-        end = min(right_candidates) + 1 if right_candidates else len(text)
+        if grenzen is None:
+            grenzen = self._satz_grenzen(text)
+
+        # Nächste Grenzen links/rechts per Binärsuche statt 4 Volltext-Scans
+        i = bisect_left(grenzen, position)
+        start = grenzen[i - 1] + 1 if i > 0 else 0
+        end = grenzen[i] + 1 if i < len(grenzen) else len(text)
         return text[start:end].strip()
     
     def _compute_density(self, n_markers, n_woerter):
-        """Berechnet Marker-Dichte pro 100 Wörter."""
+        """
+        Berechnet Marker-Dichte pro 100 Wörter.
+
+        Bewusst reine Python-Arithmetik: pro Dokument fallen hier nur
+        O(Turns) Divisionen an — ein JIT/NumPy-Umbau würde Import- und
+        Kompilierkosten einkaufen, ohne messbar etwas zurückzugeben.
+        Das gilt auch für vorab berechnete Inversen-Arrays über die
+        Turn-Wortzahlen. Der Hot Path liegt in der Regex-Suche, nicht
+        in dieser Schicht.
+        """
         if n_woerter == 0:
             return 0.0
         return round((n_markers / n_woerter) * 100, 1)
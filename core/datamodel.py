@@ -24,21 +24,130 @@ Verwendung:
 
 import re
 import json
+import time
 import hashlib
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Optional
 from datetime import datetime
 
+# Optionaler schneller JSON-Encoder (3–10× schneller als json);
+# graceful degradation wie bei spacy/nltk in core/language.py.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optionaler schneller Nicht-Krypto-Hash für Dokument-Fingerprints.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def _fingerprint(text):
+    """12-stelliger Content-Fingerprint (Audit, kein Krypto-Anspruch)."""
+    data = text.encode()
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()[:12]
+    return hashlib.md5(data).hexdigest()[:12]
+
+
+# Einmal pro Prozess kompilierte Muster für die Sprecher-Erkennung —
+# from_text läuft pro Dokument, die Kompilierung soll nicht mitlaufen.
+# Generisches Label-Pattern: Wort(e) + Doppelpunkt am Zeilenanfang.
+# Erlaubt: "Interviewer:", "Amara:", "Dr. Smith:", "Speaker A:", "I:", "B1:"
+_SPEAKER_LABEL_RE = re.compile(
+    r'^([A-ZÄÖÜ][A-Za-zäöüßÄÖÜ\.\s]{0,30}?):\s', re.MULTILINE)
+
+# Kandidaten für Inline-Sprecherwechsel ("... Satz? Amara: ...")
+_POTENTIAL_SPEAKER_RE = re.compile(r'([A-ZÄÖÜ][a-zäöüß]+):\s')
+
+# Cache der Substitutionsmuster pro Sprechername
+_INLINE_SPEAKER_RES = {}
+
+# Whitespace-Kollaps in einem Pass (kein Token-Listen-Zwischenschritt)
+_WS_RE = re.compile(r'\s+')
+
+
+def _normalize_ws(text):
+    """Kollabiert Whitespace-Läufe zu einzelnen Spaces (wie ' '.join(split()))."""
+    return _WS_RE.sub(' ', text).strip()
+
+
+# Fallback-Satzsplitter + Tokenizer-Cache pro Sprache:
+# NLTK-Import und LookupError-Probe sollen einmal pro Prozess laufen,
+# nicht einmal pro from_text.
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_TOKENIZER_CACHE = {}
+
+
+def _regex_sentence_splitter(t):
+    return [s.strip() for s in _SENT_SPLIT_RE.split(t) if s.strip()]
+
+
+def _write_jsonl(filepath, rows):
+    """
+    Schreibt Dicts als JSONL — gepuffert, ein einziger write-Syscall.
+
+    Mit orjson wird direkt UTF-8-binär encodiert; ohne orjson fällt die
+    Funktion auf json.dumps zurück (identisches Zeilenformat).
+    """
+    if orjson is not None:
+        # OPT_APPEND_NEWLINE hängt das \n schon beim Encodieren an;
+        # writelines über den Generator spart den Zwischenpuffer.
+        opt = orjson.OPT_APPEND_NEWLINE
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.writelines(orjson.dumps(row, option=opt) for row in rows)
+    else:
+        lines = [json.dumps(row, ensure_ascii=False) for row in rows]
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + ('\n' if lines else ''))
+
 
 # ============================================================
 # ANNOTATION — der Kern jeder Analyse-Ausgabe
 # ============================================================
 
-@dataclass
+def _cached_timestamp():
+    """
+    Timestamp mit Sekunden-Granularität.
+
+    datetime.now().isoformat() pro Annotation ist im Hot Path messbar;
+    für den Audit Trail reicht sekundengenaue Auflösung.
+    """
+    now = time.time()
+    if now - _TS_CACHE[0] >= 1.0:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.now().isoformat()
+    return _TS_CACHE[1]
+
+
+_TS_CACHE = [0.0, '']
+
+
+class AnnKind(IntEnum):
+    """
+    Art einer Annotation als Integer-Diskriminator.
+
+    Die Summary-/Claim-Schleifen filtern Annotations bisher über
+    kategorie.startswith('TOPOS_') etc. — ein String-Scan pro Annotation
+    und Durchlauf. Der Kind wird einmal bei der Erzeugung gesetzt,
+    danach genügt ein Integer-Vergleich.
+    """
+    FRAME = 0       # Frames, Prozessstrukturen, Affekt-Marker (Default)
+    TOPOS = 1
+    TS = 2          # Textsorten (Modul A)
+    PRON = 3
+    AGENCY = 4
+    SYNTACTIC = 5
+
+
+@dataclass(slots=True)
 class Annotation:
     """
     Eine einzelne analytische Markierung.
-    
+
     Jede Heuristik produziert Annotations — nie "Ergebnisse".
     Annotations sind prüfbar, versionierbar, exportierbar.
     """
@@ -53,7 +162,8 @@ class Annotation:
     turn_id: int                  # In welchem Turn
     confidence: str = "pattern"   # "pattern", "syntactic", "llm_suggested"
     note: str = ""                # Optional: Forschende/r-Notiz
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_cached_timestamp)
+    kind: int = AnnKind.FRAME     # AnnKind-Diskriminator (nicht exportiert)
     
     def to_dict(self):
         """Export als Dictionary (für JSON/CSV)."""
@@ -77,7 +187,7 @@ class Annotation:
 # TURN — ein einzelner Sprechbeitrag
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """Ein Sprechbeitrag im Interview."""
     turn_id: int
@@ -85,15 +195,17 @@ class Turn:
     sprecher_original: str = ""  # Original-Label aus dem Transkript (z.B. "Amara")
     text: str = ""
     saetze: list = field(default_factory=list)  # Liste von Strings
-    
-    @property
-    def n_saetze(self):
-        return len(self.saetze)
-    
-    @property
-    def n_woerter(self):
-        return len(self.text.split())
-    
+    # Einmal beim Parsing berechnet — Rohdaten sind danach unveränderlich,
+    # also muss der Text nicht bei jedem Zugriff neu gesplittet werden.
+    n_woerter: int = -1
+    n_saetze: int = -1
+
+    def __post_init__(self):
+        if self.n_woerter < 0:
+            self.n_woerter = len(self.text.split())
+        if self.n_saetze < 0:
+            self.n_saetze = len(self.saetze)
+
     @property
     def ist_befragter(self):
         """Prüft, ob dies ein Befragten-Turn ist."""
@@ -149,23 +261,25 @@ class Document:
         if known_speakers is None:
             # Versuche Sprecher zu erkennen (grob)
             # Suche nach Mustern wie "Name:" die mehrfach vorkommen
-            potential = re.findall(r'([A-ZÄÖÜ][a-zäöüß]+):\s', text)
+            potential = _POTENTIAL_SPEAKER_RE.findall(text)
             from collections import Counter
             counts = Counter(potential)
             # Nur Namen die mindestens 2x vorkommen
             known_speakers = [name for name, count in counts.items() if count >= 2]
-        
+
         if not known_speakers:
             return text
-        
+
         # Für jeden bekannten Sprecher: füge Zeilenumbruch vor "Name:" ein
         # aber nur wenn es NICHT bereits am Zeilenanfang steht
         for speaker in known_speakers:
             # Pattern: Nicht-Zeilenanfang + Satzende + Sprecher
-            pattern = rf'([.!?])\s+({re.escape(speaker)}):\s'
-            replacement = rf'\1\n\n\2: '
-            text = re.sub(pattern, replacement, text)
-        
+            compiled = _INLINE_SPEAKER_RES.get(speaker)
+            if compiled is None:
+                compiled = re.compile(rf'([.!?])\s+({re.escape(speaker)}):\s')
+                _INLINE_SPEAKER_RES[speaker] = compiled
+            text = compiled.sub(r'\1\n\n\2: ', text)
+
         return text
     
     # ---- Parsing ----
@@ -202,15 +316,16 @@ class Document:
         if preprocess:
             text = cls.preprocess_inline_speakers(text)
         
-        # Sprecher-Erkennung (generisch)
-        detected_labels = cls._detect_speakers_generic(text)
-        
+        # Sprecher-Erkennung (generisch, ein Scan über den Text)
+        marks = cls._scan_speaker_marks(text)
+        detected_labels = cls._labels_from_marks(marks)
+
         if detected_labels:
             # Klassifiziere wer Interviewer und wer Befragter ist
             if speaker_mapping is None:
-                speaker_mapping = cls._classify_speakers(text, detected_labels, interviewer_label)
-            
-            doc.turns = cls._parse_dialog(text, detected_labels, speaker_mapping, sentence_tokenizer)
+                speaker_mapping = cls._classify_speakers(text, marks, interviewer_label)
+
+            doc.turns = cls._parse_dialog(text, marks, speaker_mapping, sentence_tokenizer)
             doc.metadata['detected_speakers'] = list(detected_labels)
         else:
             doc.turns = cls._parse_monolog(text, sentence_tokenizer)
@@ -218,55 +333,77 @@ class Document:
         
         doc.metadata['parse_mode'] = 'dialog' if detected_labels else 'monolog'
         doc.metadata['speaker_mapping'] = speaker_mapping or {}
-        doc.metadata['hash'] = hashlib.md5(text.encode()).hexdigest()[:12]
+        doc.metadata['hash'] = _fingerprint(text)
         
         return doc
     
     @staticmethod
-    def _detect_speakers_generic(text):
+    def _scan_speaker_marks(text):
         """
-        Erkennt automatisch ALLE Sprecher-Labels im Text.
-        
+        EIN Scan über den Text: findet alle Sprecherwechsel-Marken.
+
         Findet jedes Muster, das wie ein Sprecher-Label aussieht:
             - Name: (Großbuchstabe am Anfang)
             - I:, B:, A1:, etc.
             - Interviewer:, Amara:, Dr. Müller:, etc.
-        
+
         Returns:
-            Set von gefundenen Labels oder None
-        
-        WICHTIG: Gibt nur zurück wenn mindestens 2 VERSCHIEDENE Sprecher erkannt werden!
+            Liste von (label, match_start, inhalt_start) in Textreihenfolge.
+            Klassifikation und Dialog-Parsing arbeiten auf diesen Marken,
+            ohne den Text erneut per Regex zu durchlaufen.
         """
-        # Generisches Pattern: Wort(e) gefolgt von Doppelpunkt am Zeilenanfang
-        # Erlaubt: "Interviewer:", "Amara:", "Dr. Smith:", "Speaker A:", "I:", "B1:"
-        pattern = r'^([A-ZÄÖÜ][A-Za-zäöüßÄÖÜ\.\s]{0,30}?):\s'
-        
-        matches = re.findall(pattern, text, re.MULTILINE)
-        
-        if matches:
-            # Bereinigen: Whitespace trimmen
-            labels = set(m.strip() for m in matches)
-            
-            # FIX: Mindestens 2 VERSCHIEDENE Sprecher (nicht nur 2 Turns)
-            if len(labels) >= 2:
-                return labels
-        
-        return None  # Kein Dialog erkannt → Monolog
-    
+        return [
+            (m.group(1).strip(), m.start(), m.end())
+            for m in _SPEAKER_LABEL_RE.finditer(text)
+        ]
+
     @staticmethod
-    def _classify_speakers(text, detected_labels, explicit_interviewer=None):
+    def _labels_from_marks(marks):
+        """
+        Sprecher-Labels aus den Marken ableiten.
+
+        WICHTIG: Gibt nur zurück wenn mindestens 2 VERSCHIEDENE Sprecher
+        erkannt werden — sonst None (→ Monolog).
+        """
+        labels = set(label for label, _, _ in marks)
+        if len(labels) >= 2:
+            return labels
+        return None
+
+    @staticmethod
+    def _detect_speakers_generic(text):
+        """
+        Erkennt automatisch ALLE Sprecher-Labels im Text.
+
+        Returns:
+            Set von gefundenen Labels oder None (Monolog).
+        """
+        return Document._labels_from_marks(Document._scan_speaker_marks(text))
+
+    @staticmethod
+    def _turn_slices(text, marks):
+        """Zerlegt den Text anhand der Marken in (label, inhalt)-Paare."""
+        slices = []
+        for i, (label, _, inhalt_start) in enumerate(marks):
+            ende = marks[i + 1][1] if i + 1 < len(marks) else len(text)
+            slices.append((label, text[inhalt_start:ende]))
+        return slices
+
+    @staticmethod
+    def _classify_speakers(text, marks, explicit_interviewer=None):
         """
         Klassifiziert die erkannten Sprecher als Interviewer oder Befragter.
-        
+
         Heuristiken:
             1. Explizite Interviewer-Labels: "Interviewer", "I", "Interviewerin", "Int"
             2. Wer stellt mehr Fragen? (Fragezeichen-Häufigkeit)
             3. Wer hat kürzere Turns? (Interviewer sind meist kürzer)
             4. Wer spricht zuerst? (oft Interviewer)
-        
+
         Returns:
             Dict {original_label: "Interviewer"/"Befragter"}
         """
+        detected_labels = set(label for label, _, _ in marks)
         # Bekannte Interviewer-Labels
         interviewer_keywords = {
             'interviewer', 'interviewerin', 'int', 'i', 
@@ -299,31 +436,22 @@ class Document:
         unclassified = [l for l in detected_labels if l not in mapping]
         
         if unclassified:
-            # Analysiere Turn-Eigenschaften
+            # Analysiere Turn-Eigenschaften (über die Marken, kein Regex-Pass)
+            turns_per_label = {}
+            for label, inhalt in Document._turn_slices(text, marks):
+                turns_per_label.setdefault(label, []).append(inhalt)
+
             turn_stats = {}
-            
-            for label in detected_labels:
-                # Finde alle Turns dieses Sprechers
-                escaped_label = re.escape(label)
-                other_labels = [re.escape(l) for l in detected_labels if l != label]
-                if other_labels:
-                    end_pattern = '|'.join(other_labels)
-                    pattern = rf'^{escaped_label}:\s*(.+?)(?=^(?:{end_pattern}):\s|\Z)'
-                else:
-                    pattern = rf'^{escaped_label}:\s*(.+?)(?=\Z)'
-                
-                turns = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
-                
-                if turns:
-                    total_text = ' '.join(turns)
-                    avg_length = len(total_text) / len(turns)
-                    question_ratio = total_text.count('?') / max(len(turns), 1)
-                    
-                    turn_stats[label] = {
-                        'n_turns': len(turns),
-                        'avg_length': avg_length,
-                        'question_ratio': question_ratio,
-                    }
+            for label, turns in turns_per_label.items():
+                total_text = ' '.join(turns)
+                avg_length = len(total_text) / len(turns)
+                question_ratio = total_text.count('?') / max(len(turns), 1)
+
+                turn_stats[label] = {
+                    'n_turns': len(turns),
+                    'avg_length': avg_length,
+                    'question_ratio': question_ratio,
+                }
             
             # Interviewer: mehr Fragen, kürzere Turns
             for label in unclassified:
@@ -364,18 +492,12 @@ class Document:
         return mapping
     
     @staticmethod
-    def _parse_dialog(text, detected_labels, speaker_mapping, sent_tokenizer):
-        """Parst einen Dialog mit Sprecher-Labels."""
-        # Regex aus den Labels bauen (sortiert nach Länge, längste zuerst)
-        sorted_labels = sorted(detected_labels, key=len, reverse=True)
-        label_pattern = '|'.join(re.escape(k) for k in sorted_labels)
-        pattern = rf'^({label_pattern}):\s*(.+?)(?=^(?:{label_pattern}):\s|\Z)'
-        
-        matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
+    def _parse_dialog(text, marks, speaker_mapping, sent_tokenizer):
+        """Parst einen Dialog anhand der vorab gescannten Sprecher-Marken."""
         turns = []
-        
-        for i, (sprecher_raw, inhalt) in enumerate(matches):
-            inhalt_bereinigt = ' '.join(inhalt.split())
+
+        for i, (sprecher_raw, inhalt) in enumerate(Document._turn_slices(text, marks)):
+            inhalt_bereinigt = _normalize_ws(inhalt)
             
             # Generisches Label zuweisen
             sprecher_generisch = speaker_mapping.get(sprecher_raw, "Befragter")
@@ -403,7 +525,7 @@ class Document:
         
         turns = []
         for i, absatz in enumerate(absaetze):
-            bereinigt = ' '.join(absatz.split())
+            bereinigt = _normalize_ws(absatz)
             saetze = sent_tokenizer(bereinigt)
             turns.append(Turn(
                 turn_id=i + 1,
@@ -417,7 +539,16 @@ class Document:
     
     @staticmethod
     def _default_sentence_tokenizer(language):
-        """Gibt einen Satz-Tokenizer für die Sprache zurück."""
+        """Gibt einen Satz-Tokenizer für die Sprache zurück (memoized)."""
+        tok = _TOKENIZER_CACHE.get(language)
+        if tok is None:
+            tok = Document._build_sentence_tokenizer(language)
+            _TOKENIZER_CACHE[language] = tok
+        return tok
+
+    @staticmethod
+    def _build_sentence_tokenizer(language):
+        """Baut den Tokenizer: NLTK wenn Ressourcen da sind, sonst Regex."""
         lang_map = {
             'de': 'german', 'en': 'english', 'fr': 'french',
             'es': 'spanish', 'it': 'italian', 'pt': 'portuguese',
@@ -425,24 +556,32 @@ class Document:
         }
         lang = lang_map.get(language, 'english')
 
-        def regex_splitter(t: str):
-            return [s.strip() for s in re.split(r'(?<=[.!?])\s+', t) if s.strip()]
-
         try:
             from nltk.tokenize import sent_tokenize
+        except ImportError:
+            return _regex_sentence_splitter
+
+        # LookupError-Probe einmal beim Bauen statt bei jedem Satz-Split
+        try:
+            sent_tokenize("Probe.", language=lang)
+        except LookupError:
+            return _regex_sentence_splitter
 
-            def tok(t: str):
-                try:
-                    return sent_tokenize(t, language=lang)
-                except LookupError:
-                    return regex_splitter(t)
+        def tok(t: str):
+            return sent_tokenize(t, language=lang)
 
-            return tok
-        except ImportError:
-            return regex_splitter
+        return tok
     
     # ---- Zugriff ----
     
+    def get_turn(self, turn_id):
+        """Gibt den Turn mit dieser ID zurück (O(1) über lazy Index)."""
+        index = self.__dict__.get('_turn_by_id')
+        if index is None or len(index) != len(self.turns):
+            index = {t.turn_id: t for t in self.turns}
+            self._turn_by_id = index
+        return index.get(turn_id)
+
     def get_turns(self, sprecher=None):
         """Gibt Turns zurück, optional gefiltert nach Sprecher."""
         if sprecher is None:
@@ -461,30 +600,79 @@ class Document:
         """Gibt nur die Turns des Interviewers zurück."""
         return [t for t in self.turns if t.sprecher == "Interviewer"]
     
+    def _annotation_index(self):
+        """
+        Lazy Index über die Annotations (modul/kategorie/turn_id → Liste).
+
+        Wird bei veränderter Annotation-Anzahl neu aufgebaut, damit auch
+        direkte extends (z.B. beim Merge aus Worker-Prozessen) sicher sind.
+        """
+        idx = self.__dict__.get('_ann_idx')
+        if idx is None or idx['n'] != len(self.annotations):
+            by_modul, by_kategorie, by_turn = {}, {}, {}
+            by_modul_turn = {}
+            for a in self.annotations:
+                by_modul.setdefault(a.modul, []).append(a)
+                by_kategorie.setdefault(a.kategorie, []).append(a)
+                by_turn.setdefault(a.turn_id, []).append(a)
+                # Kombinierter Key für die häufigste Abfrage der Module
+                # (modul + turn_id) → O(1) statt Nachfiltern pro Turn
+                by_modul_turn.setdefault((a.modul, a.turn_id), []).append(a)
+            idx = {'n': len(self.annotations), 'modul': by_modul,
+                   'kategorie': by_kategorie, 'turn': by_turn,
+                   'modul_turn': by_modul_turn}
+            self._ann_idx = idx
+        return idx
+
     def get_annotations(self, modul=None, kategorie=None, turn_id=None):
-        """Filtert Annotations."""
-        result = self.annotations
-        if modul:
-            result = [a for a in result if a.modul == modul]
-        if kategorie:
-            result = [a for a in result if a.kategorie == kategorie]
-        if turn_id:
-            result = [a for a in result if a.turn_id == turn_id]
+        """Filtert Annotations (über Index statt Linear-Scans)."""
+        if modul is None and kategorie is None and turn_id is None:
+            return self.annotations
+
+        idx = self._annotation_index()
+
+        # Selektivsten Filter als Kandidatenliste nehmen, Rest nachfiltern
+        if turn_id is not None:
+            if modul and not kategorie:
+                return idx['modul_turn'].get((modul, turn_id), [])
+            result = idx['turn'].get(turn_id, [])
+            if modul:
+                result = [a for a in result if a.modul == modul]
+            if kategorie:
+                result = [a for a in result if a.kategorie == kategorie]
+        elif kategorie:
+            result = idx['kategorie'].get(kategorie, [])
+            if modul:
+                result = [a for a in result if a.modul == modul]
+        else:
+            result = idx['modul'].get(modul, [])
         return result
     
     def add_annotation(self, annotation):
         """Fügt eine Annotation hinzu."""
         self.annotations.append(annotation)
+
+    def add_annotations(self, annotations):
+        """
+        Fügt mehrere Annotations hinzu (akzeptiert auch Generatoren).
+
+        Returns:
+            Anzahl der hinzugefügten Annotations.
+        """
+        vorher = len(self.annotations)
+        self.annotations.extend(annotations)
+        return len(self.annotations) - vorher
     
     # ---- Export ----
     
     def annotations_to_jsonl(self, filepath):
-        """Exportiert alle Annotations als JSONL."""
-        with open(filepath, 'w', encoding='utf-8') as f:
+        """Exportiert alle Annotations als JSONL (gepuffert, orjson wenn verfügbar)."""
+        def rows():
             for a in self.annotations:
                 d = a.to_dict()
                 d['doc_id'] = self.doc_id
-                f.write(json.dumps(d, ensure_ascii=False) + '\n')
+                yield d
+        _write_jsonl(filepath, rows())
     
     def summary(self):
         """Gibt eine Zusammenfassung des Dokuments zurück."""
@@ -533,6 +721,21 @@ class Document:
 # CORPUS — Sammlung von Interviews
 # ============================================================
 
+def _analyse_document(args):
+    """Worker für Corpus.map_analyse: analysiert ein Document im Subprozess.
+
+    Gibt nur die NEU erzeugten Annotations zurück — der Parent hängt das
+    Ergebnis an sein Original an, und bereits vorhandene Annotations
+    kämen sonst doppelt zurück (und würden doppelt gezählt, anders als
+    im seriellen Pfad).
+    """
+    module_factory, doc = args
+    n0 = len(doc.annotations)
+    for modul in module_factory(doc):
+        modul.analyse(doc)
+    return doc.annotations[n0:]
+
+
 @dataclass
 class Corpus:
     """
@@ -546,12 +749,60 @@ class Corpus:
         self.documents.append(doc)
     
     def get(self, doc_id):
-        """Findet ein Document nach ID."""
-        for doc in self.documents:
-            if doc.doc_id == doc_id:
-                return doc
-        return None
-    
+        """Findet ein Document nach ID (O(1) über lazy Index)."""
+        index = self.__dict__.get('_by_id')
+        if index is None or len(index) != len(self.documents):
+            index = {doc.doc_id: doc for doc in self.documents}
+            self._by_id = index
+        return index.get(doc_id)
+    
+    def map_analyse(self, module_factory, n_workers=None):
+        """
+        Analysiert alle Dokumente parallel über einen Prozess-Pool.
+
+        Die Analyse ist auf Dokumentebene trivial parallelisierbar und
+        CPU-gebunden (Regex) → near-lineare Skalierung über Kerne.
+
+        Args:
+            module_factory: Top-Level-Funktion (picklebar), die für ein
+                            Document die Liste der Analysemodule baut.
+            n_workers: Anzahl Prozesse (Default: CPU-Anzahl)
+
+        Returns:
+            Gesamtzahl der erzeugten Annotations.
+        """
+        import os
+        docs = self.documents
+        if not docs:
+            return 0
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        # Seriell, wenn Parallelisierung sich nicht lohnt
+        if n_workers <= 1 or len(docs) == 1:
+            total = 0
+            for doc in docs:
+                for modul in module_factory(doc):
+                    total += modul.analyse(doc)
+            return total
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(docs) // (4 * n_workers))
+        total = 0
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            # Worker arbeiten auf Kopien → Annotations zurückmergen
+            results = executor.map(
+                _analyse_document,
+                [(module_factory, doc) for doc in docs],
+                chunksize=chunksize,
+            )
+            for doc, anns in zip(docs, results):
+                doc.annotations.extend(anns)
+                total += len(anns)
+        return total
+
     def all_annotations(self, modul=None):
         """Alle Annotations über alle Dokumente, optional gefiltert."""
         result = []
@@ -563,20 +814,29 @@ class Corpus:
                 result.append(d)
         return result
     
+    def summary_rows(self):
+        """
+        Vergleichsdaten über alle Dokumente als Liste von Dicts.
+
+        Pandas-frei — für Skripte/REPL, die keine DataFrame brauchen
+        (der pandas-Import allein kostet mehrere 100 ms Kaltstart).
+        """
+        return [doc.summary() for doc in self.documents]
+
     def summary_table(self):
-        """Vergleichstabelle über alle Dokumente."""
+        """Vergleichstabelle über alle Dokumente (als DataFrame)."""
         import pandas as pd
-        rows = [doc.summary() for doc in self.documents]
-        return pd.DataFrame(rows)
+        return pd.DataFrame.from_records(self.summary_rows())
     
     def export_all_annotations(self, filepath):
-        """Exportiert alle Annotations aller Dokumente als JSONL."""
-        with open(filepath, 'w', encoding='utf-8') as f:
+        """Exportiert alle Annotations aller Dokumente als JSONL (gepuffert)."""
+        def rows():
             for doc in self.documents:
                 for a in doc.annotations:
                     d = a.to_dict()
                     d['doc_id'] = doc.doc_id
-                    f.write(json.dumps(d, ensure_ascii=False) + '\n')
+                    yield d
+        _write_jsonl(filepath, rows())
     
     def __len__(self):
         return len(self.documents)
@@ -2,94 +2,244 @@
 core/export.py – Standardisierte Export-Formate.
 """
 
-import json
+import csv
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from .datamodel import _write_jsonl
+
+
+def _write_csv(filepath, header, rows):
+    """
+    Schreibt Zeilen über den stdlib-csv-Writer (C-Pfad, gepuffert).
+
+    Umgeht die per-Zelle-Formatierung von DataFrame.to_csv; Nicht-Strings
+    werden wie dort über str() gerendert.
+    """
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+
 
 def export_annotations_jsonl(corpus, filepath):
-    """Exportiert alle Annotations als JSONL."""
-    with open(filepath, 'w', encoding='utf-8') as f:
+    """Exportiert alle Annotations als JSONL (gepuffert, orjson wenn verfügbar)."""
+    def rows():
         for doc in corpus.documents:
+            doc_id, language = doc.doc_id, doc.language
             for ann in doc.annotations:
-                row = ann.to_dict()
-                row['doc_id'] = doc.doc_id
-                row['language'] = doc.language
-                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                yield {**ann.to_dict(), 'doc_id': doc_id, 'language': language}
+    _write_jsonl(filepath, rows())
     total = sum(len(doc.annotations) for doc in corpus.documents)
     print(f"  {total} Annotations → {filepath}")
 
 
-def export_turn_summary(corpus, modules_dict, filepath):
-    """Exportiert Turn-Level-Zusammenfassung als CSV."""
-    rows = []
+def _index_annotations(doc):
+    """Gruppiert die Annotations eines Documents nach turn_id → modul (ein Pass)."""
+    idx = {}
+    for a in doc.annotations:
+        idx.setdefault(a.turn_id, {}).setdefault(a.modul, []).append(a)
+    return idx
+
+
+def _annotations_df(corpus):
+    """Alle Annotations des Corpus als flacher DataFrame (ein Pass)."""
+    rows = [
+        (doc.doc_id, a.turn_id, a.modul, a.kategorie)
+        for doc in corpus.documents
+        for a in doc.annotations
+    ]
+    return pd.DataFrame(rows, columns=['doc_id', 'turn_id', 'modul', 'kategorie'])
+
+
+def export_turn_summary(corpus, modules_dict, filepath, turns_by_doc=None):
+    """
+    Exportiert Turn-Level-Zusammenfassung als CSV.
+
+    Aggregiert über EINE groupby-Passage statt get_annotations-Aufrufen
+    pro Turn × Modul (das Filtern lief sonst O(D·T·M) in Python).
+    `turns_by_doc` (doc_id → Turns) kann wie doc_summaries vorberechnet
+    übergeben werden; export_all teilt es mit export_excel.
+    """
+    if turns_by_doc is None:
+        turns_by_doc = {doc.doc_id: doc.get_befragte_turns()
+                        for doc in corpus.documents}
+    meta_rows = []
     for doc in corpus.documents:
-        for turn in doc.get_befragte_turns():
-            row = {
+        for turn in turns_by_doc[doc.doc_id]:
+            meta_rows.append({
                 'doc_id': doc.doc_id, 'turn_id': turn.turn_id,
                 'sprecher': turn.sprecher, 'n_woerter': turn.n_woerter,
                 'n_saetze': turn.n_saetze, 'text_vorschau': turn.text[:150],
-            }
-            for mname, modul in modules_dict.items():
-                anns = doc.get_annotations(modul=modul.modul_id, turn_id=turn.turn_id)
-                row[f'{mname}_n'] = len(anns)
-                row[f'{mname}_kat'] = '; '.join(sorted(set(a.kategorie for a in anns)))
-            total = len(doc.get_annotations(turn_id=turn.turn_id))
-            row['total_n'] = total
-            row['total_dichte'] = round((total / max(turn.n_woerter, 1)) * 100, 1)
-            rows.append(row)
-    pd.DataFrame(rows).to_csv(filepath, index=False, encoding='utf-8')
-    print(f"  {len(rows)} Turns → {filepath}")
-
-
-def export_doc_summary(corpus, filepath):
-    """Exportiert Interview-Level-Kennwerte als CSV."""
-    pd.DataFrame([doc.summary() for doc in corpus.documents]).to_csv(
-        filepath, index=False, encoding='utf-8')
+            })
+    meta = pd.DataFrame(meta_rows)
+    if meta.empty:
+        meta.to_csv(filepath, index=False, encoding='utf-8')
+        print(f"  0 Turns → {filepath}")
+        return
+
+    meta = meta.set_index(['doc_id', 'turn_id'])
+    df = _annotations_df(corpus)
+
+    if not df.empty:
+        # Kategorie als Categorical: unique() läuft dann über die
+        # Integer-Codes im NumPy-Pfad statt über ein Python-Set pro Gruppe.
+        df['kategorie'] = df['kategorie'].astype('category')
+        grp = df.groupby(['doc_id', 'turn_id', 'modul'], sort=False, observed=True)
+        counts = grp.size().unstack('modul', fill_value=0)
+        kats = grp['kategorie'].agg(
+            lambda s: '; '.join(sorted(s.unique()))).unstack('modul', fill_value='')
+        totals = df.groupby(['doc_id', 'turn_id'], sort=False).size()
+    else:
+        counts = kats = totals = None
+
+    # Modul-Spalten (Name, ID, Spaltenkeys) einmal vorberechnen
+    cols = [(modul.modul_id, f'{mname}_n', f'{mname}_kat')
+            for mname, modul in modules_dict.items()]
+    for mid, key_n, key_kat in cols:
+        if counts is not None and mid in counts.columns:
+            meta[key_n] = counts[mid].reindex(meta.index, fill_value=0)
+            meta[key_kat] = kats[mid].reindex(meta.index, fill_value='')
+        else:
+            meta[key_n] = 0
+            meta[key_kat] = ''
+
+    meta['total_n'] = (totals.reindex(meta.index, fill_value=0)
+                       if totals is not None else 0)
+    # Dichte vektorisiert in einem NumPy-Pass (clip/div/round als ufuncs)
+    # statt round()-Aufrufen pro Zeile
+    meta['total_dichte'] = (
+        (meta['total_n'] / meta['n_woerter'].clip(lower=1)) * 100).round(1)
+
+    out = meta.reset_index()
+    _write_csv(filepath, list(out.columns), out.itertuples(index=False, name=None))
+    print(f"  {len(meta)} Turns → {filepath}")
+
+
+def export_doc_summary(corpus, filepath, doc_summaries=None):
+    """
+    Exportiert Interview-Level-Kennwerte als CSV.
+
+    `doc_summaries` kann vorberechnet übergeben werden (export_all teilt
+    die Liste mit export_excel, damit summary() nur einmal läuft).
+    """
+    rows = (doc_summaries if doc_summaries is not None
+            else [doc.summary() for doc in corpus.documents])
+    header = list(rows[0].keys()) if rows else []
+    _write_csv(filepath, header, ([r.get(k) for k in header] for r in rows))
     print(f"  {len(corpus)} Dokumente → {filepath}")
 
 
-def export_excel(corpus, modules_dict, filepath):
-    """Exportiert alles als Excel mit mehreren Sheets."""
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # Sheet 1: Dokument-Übersicht
-        pd.DataFrame([doc.summary() for doc in corpus.documents]).to_excel(
-            writer, sheet_name='Dokumente', index=False)
-        
-        # Sheet 2: Turn-Summary
-        rows = []
+def _excel_cell(value):
+    """openpyxl-taugliche Zelle: Nicht-Skalare (Dicts/Listen) als String."""
+    if value is None or isinstance(value, (int, float, str, bool)):
+        return value
+    return str(value)
+
+
+def export_excel(corpus, modules_dict, filepath, doc_summaries=None,
+                 turns_by_doc=None):
+    """
+    Exportiert alles als Excel mit mehreren Sheets.
+
+    `doc_summaries`/`turns_by_doc` wie bei den CSV-Exporten:
+    optional vorberechnet und zwischen den Writern geteilt.
+
+    Nutzt openpyxl im write_only-Modus: Zeilen werden gestreamt statt als
+    vollständiges Zellen-Grid (inkl. Style-Objekten) im Speicher gehalten —
+    auf dem Annotations-Sheet mit tausenden Zeilen der dominante Kostenpunkt.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    def append_dict_rows(sheet_name, rows):
+        ws = wb.create_sheet(sheet_name)
+        header = None
+        for row in rows:
+            if header is None:
+                header = list(row.keys())
+                ws.append(header)
+            ws.append([_excel_cell(row.get(k)) for k in header])
+
+    # Sheet 1: Dokument-Übersicht
+    append_dict_rows('Dokumente',
+                     doc_summaries if doc_summaries is not None
+                     else (doc.summary() for doc in corpus.documents))
+
+    # Sheet 2: Turn-Summary
+    # Spaltenkeys und Modul-IDs einmal statt pro Turn × Modul auflösen
+    cols = [(f'{mname}_n', modul.modul_id)
+            for mname, modul in modules_dict.items()]
+
+    def turn_rows():
         for doc in corpus.documents:
-            for turn in doc.get_befragte_turns():
+            # Einmal gruppieren statt get_annotations pro Turn × Modul
+            idx = _index_annotations(doc)
+            turns = (turns_by_doc[doc.doc_id] if turns_by_doc is not None
+                     else doc.get_befragte_turns())
+            for turn in turns:
                 row = {'doc_id': doc.doc_id, 'turn_id': turn.turn_id,
                        'n_woerter': turn.n_woerter}
-                for mname, modul in modules_dict.items():
-                    anns = doc.get_annotations(modul=modul.modul_id, turn_id=turn.turn_id)
-                    row[f'{mname}_n'] = len(anns)
-                rows.append(row)
-        pd.DataFrame(rows).to_excel(writer, sheet_name='Turns', index=False)
-        
-        # Sheet 3: Alle Annotations
-        ann_rows = []
+                per_modul = idx.get(turn.turn_id, {})
+                for key_n, mid in cols:
+                    row[key_n] = len(per_modul.get(mid, ()))
+                yield row
+
+    append_dict_rows('Turns', turn_rows())
+
+    # Sheet 3: Alle Annotations — zeilenweise gestreamt, ohne
+    # Zwischenliste oder DataFrame (Speicher O(1) pro Zeile statt O(N))
+    def ann_rows():
         for doc in corpus.documents:
             for a in doc.annotations:
                 d = a.to_dict()
                 d['doc_id'] = doc.doc_id
-                ann_rows.append(d)
-        if ann_rows:
-            pd.DataFrame(ann_rows).to_excel(writer, sheet_name='Annotations', index=False)
-    
+                yield d
+
+    append_dict_rows('Annotations', ann_rows())
+
+    wb.save(filepath)
     print(f"  Excel → {filepath}")
 
 
 def export_all(corpus, modules_dict, output_dir):
-    """Exportiert alle Formate auf einmal."""
+    """
+    Exportiert alle Formate auf einmal.
+
+    Die vier Writer lesen den Corpus nur und schreiben in getrennte
+    Dateien → sie laufen parallel in einem ThreadPoolExecutor. Während
+    I/O und der pandas/openpyxl-C-Pfade geben die Threads den GIL frei;
+    die Gesamtzeit nähert sich dem langsamsten Format (Excel) statt der
+    Summe. Die einzeiligen Status-Prints bleiben unter dem GIL atomar.
+    """
     os.makedirs(output_dir, exist_ok=True)
     ts = datetime.now().strftime('%Y%m%d_%H%M')
-    
+
     print(f"=== Export ({ts}) ===")
-    export_annotations_jsonl(corpus, os.path.join(output_dir, f'annotations_{ts}.jsonl'))
-    export_turn_summary(corpus, modules_dict, os.path.join(output_dir, f'turn_summary_{ts}.csv'))
-    export_doc_summary(corpus, os.path.join(output_dir, f'doc_summary_{ts}.csv'))
-    export_excel(corpus, modules_dict, os.path.join(output_dir, f'analyse_{ts}.xlsx'))
+    # summary() und Befragten-Turns einmal materialisieren; CSV- und
+    # Excel-Writer lesen die Strukturen nur noch (thread-sicher, da
+    # unverändert geteilt).
+    doc_summaries = [doc.summary() for doc in corpus.documents]
+    turns_by_doc = {doc.doc_id: doc.get_befragte_turns()
+                    for doc in corpus.documents}
+    jobs = [
+        (export_annotations_jsonl,
+         (corpus, os.path.join(output_dir, f'annotations_{ts}.jsonl'))),
+        (export_turn_summary,
+         (corpus, modules_dict, os.path.join(output_dir, f'turn_summary_{ts}.csv'),
+          turns_by_doc)),
+        (export_doc_summary,
+         (corpus, os.path.join(output_dir, f'doc_summary_{ts}.csv'),
+          doc_summaries)),
+        (export_excel,
+         (corpus, modules_dict, os.path.join(output_dir, f'analyse_{ts}.xlsx'),
+          doc_summaries, turns_by_doc)),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(fn, *args) for fn, args in jobs]
+        for future in futures:
+            future.result()
     print("✅ Export abgeschlossen.")
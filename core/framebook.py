@@ -18,9 +18,32 @@ Verwendung:
     fb.overlay_name          → Name des Overlays (oder None)
 """
 
+import mmap
 import os
-import copy
 import yaml
+from functools import cached_property
+
+# C-beschleunigter Loader (libyaml), wenn PyYAML damit gebaut wurde;
+# sonst der reine Python-SafeLoader — semantisch identisch.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _read_yaml(filepath):
+    """
+    Parst eine YAML-Datei über ein mmap — der Loader liest direkt aus
+    den OS-gemappten Seiten, ohne die Datei vorher als Bytes-Puffer in
+    den Prozess zu kopieren. Leere Dateien (mmap verbietet Länge 0)
+    fallen auf normales Lesen zurück.
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_YamlLoader)
+        except ValueError:
+            return yaml.load(f.read(), Loader=_YamlLoader)
 
 
 class Framebook:
@@ -32,8 +55,7 @@ class Framebook:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Framebook nicht gefunden: {filepath}")
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            self._data = yaml.safe_load(f)
+        self._data = _read_yaml(filepath)
 
         self.filepath = filepath
         self.version = self._data.get('version', 'unbekannt')
@@ -59,9 +81,23 @@ class Framebook:
         # Overlay
         self.overlay_name = None
         self._overlay_data = None
+        # Persistente Duplikat-Sets für _merge_indikatoren
+        self._merge_sets = {}
+        # Listen, die wir selbst angelegt/kopiert haben (Copy-on-Write)
+        self._owned_lists = set()
         if overlay:
             self._load_overlay(overlay)
 
+        # Frame-Namen einmal einfrieren (nach Overlay-Merge) —
+        # Validierung und Abfragen brauchen keine Neuberechnung pro Aufruf.
+        self._known_frames = frozenset(self.frames)
+
+        # Inverser Conflict-Index: downweight-Frame → Regeln (O(1)-Abfrage)
+        self._conflicts_by_downweight = {}
+        for c in self.frame_conflicts:
+            self._conflicts_by_downweight.setdefault(
+                c.get('downweight'), []).append(c)
+
         self._validate()
 
     # ── Overlay-Logik ──────────────────────────────────
@@ -71,8 +107,7 @@ class Framebook:
         if not os.path.exists(overlay_path):
             raise FileNotFoundError(f"Overlay nicht gefunden: {overlay_path}")
 
-        with open(overlay_path, 'r', encoding='utf-8') as f:
-            ov = yaml.safe_load(f)
+        ov = _read_yaml(overlay_path)
 
         self._overlay_data = ov
         self.overlay_name = ov.get('overlay', {}).get('name', overlay_path)
@@ -95,12 +130,30 @@ class Framebook:
         for topos_name, topos_def in ov.get('overlay_topoi', {}).items():
             self.topoi[topos_name] = topos_def
 
-        # 5) Frame-Spannungen ergänzen
-        self.frame_spannungen.extend(ov.get('overlay_frame_spannungen', []))
+        # 5) Frame-Spannungen ergänzen (ohne Duplikate — sonst warnt
+        #    die Validierung mehrfach über denselben Eintrag)
+        self._extend_dedup(self.frame_spannungen,
+                           ov.get('overlay_frame_spannungen', []))
 
         # 6) Overlay-Priorities/Conflicts ergänzen (falls vorhanden)
         self.frame_priorities.update(ov.get('frame_priorities', {}))
-        self.frame_conflicts.extend(ov.get('frame_conflicts', []))
+        self._extend_dedup(self.frame_conflicts,
+                           ov.get('frame_conflicts', []))
+
+    @staticmethod
+    def _extend_dedup(target, entries):
+        """Hängt Regel-Dicts an, lässt exakte Duplikate aber aus (ein Pass)."""
+        def key(d):
+            return tuple(sorted((k, str(v)) for k, v in d.items()))
+
+        seen = {key(e) for e in target}
+        neu = []
+        for e in entries:
+            k = key(e)
+            if k not in seen:
+                seen.add(k)
+                neu.append(e)
+        target.extend(neu)
 
     def _merge_indikatoren(self, target, extension):
         """Hängt Overlay-Indikatoren an bestehende Indikatoren an."""
@@ -108,13 +161,31 @@ class Framebook:
         if 'indikatoren' not in target:
             target['indikatoren'] = {}
         for lang, patterns in ext_ind.items():
-            if lang not in target['indikatoren']:
-                target['indikatoren'][lang] = []
-            # Duplikate vermeiden
-            existing = set(target['indikatoren'][lang])
-            for p in patterns:
-                if p not in existing:
-                    target['indikatoren'][lang].append(p)
+            ziel = target['indikatoren'].get(lang)
+            if ziel is None:
+                ziel = target['indikatoren'][lang] = []
+                self._owned_lists.add(id(ziel))
+            # Duplikat-Set pro (Ziel, Sprache) persistent halten,
+            # statt es bei jedem Merge neu aus der Liste aufzubauen.
+            key = (id(target), lang)
+            existing = self._merge_sets.get(key)
+            if existing is None:
+                existing = self._merge_sets[key] = set(ziel)
+            # dict.fromkeys: dedupliziert das Overlay selbst in einem
+            # Hash-Pass und erhält dabei die Reihenfolge.
+            neu = [p for p in dict.fromkeys(patterns) if p not in existing]
+            if not neu:
+                continue
+            # Copy-on-Write: geparste Listen können (z.B. über
+            # YAML-Anker) in mehreren Frames stecken — vor dem ersten
+            # Anhängen durch eine eigene Kopie ersetzen statt die
+            # geteilte Liste in place zu mutieren.
+            if id(ziel) not in self._owned_lists:
+                ziel = list(ziel)
+                target['indikatoren'][lang] = ziel
+                self._owned_lists.add(id(ziel))
+            ziel.extend(neu)
+            existing.update(neu)
 
     # ── Validation ─────────────────────────────────────
 
@@ -131,31 +202,27 @@ class Framebook:
             if not getattr(self, section):
                 warnings.append(f"Sektion '{section}' fehlt oder ist leer")
 
-        # Validate frame_spannungen references
-        known_frames = set(self.frames.keys())
-        for sp in self.frame_spannungen:
-            for key in ('frame_a', 'frame_b'):
-                if sp.get(key) not in known_frames:
-                    warnings.append(
-                        f"Frame-Spannung referenziert unbekannten Frame: '{sp.get(key)}'"
-                    )
-
-        # Validate priorities reference known frames
-        for frame_name in self.frame_priorities:
-            if frame_name not in known_frames:
+        # Frame-Referenzen aus allen Regel-Sektionen einsammeln und in
+        # EINER Set-Differenz gegen die bekannten Frames prüfen — statt
+        # Membership-Check plus f-String pro Eintrag. Eine Warnung pro
+        # Sektion listet alle fehlenden Namen auf einmal.
+        referenz_sektionen = [
+            ('frame_spannungen',
+             {sp.get(k) for sp in self.frame_spannungen
+              for k in ('frame_a', 'frame_b')}),
+            ('frame_priorities', set(self.frame_priorities)),
+            ('frame_conflicts',
+             {c.get(k) for c in self.frame_conflicts
+              for k in ('if_present', 'downweight')}),
+        ]
+        for sektion, refs in referenz_sektionen:
+            missing = refs - self._known_frames
+            if missing:
                 warnings.append(
-                    f"frame_priorities referenziert unbekannten Frame: '{frame_name}'"
+                    f"{sektion} referenziert unbekannte Frames: "
+                    + ', '.join(sorted(str(m) for m in missing))
                 )
 
-        # Validate conflicts reference known frames
-        for conflict in self.frame_conflicts:
-            for key in ('if_present', 'downweight'):
-                if conflict.get(key) not in known_frames:
-                    warnings.append(
-                        f"frame_conflicts referenziert unbekannten Frame: "
-                        f"'{conflict.get(key)}'"
-                    )
-
         if warnings:
             print(f"⚠️  Framebook-Warnungen:")
             for w in warnings:
@@ -169,13 +236,11 @@ class Framebook:
 
     def get_conflicts_for(self, frame_name):
         """Gibt alle Conflict-Regeln zurück, die diesen Frame downweighten."""
-        return [
-            c for c in self.frame_conflicts
-            if c.get('downweight') == frame_name
-        ]
+        return self._conflicts_by_downweight.get(frame_name, [])
 
-    def get_languages(self):
-        """Gibt alle Sprachen zurück, die im Framebook definiert sind."""
+    @cached_property
+    def languages(self):
+        """Alle Sprachen, die im Framebook definiert sind (einmal berechnet)."""
         langs = set()
         for section in [self.textsorten, self.prozessstrukturen,
                         self.agency, self.frames, self.topoi,
@@ -186,12 +251,16 @@ class Framebook:
         langs.update(self.pronomen.keys())
         return sorted(langs)
 
+    def get_languages(self):
+        """Gibt alle Sprachen zurück (Back-Compat-Wrapper um `languages`)."""
+        return self.languages
+
     def summary(self):
         """Übersicht über das Framebook."""
         result = {
             'version': self.version,
             'beschreibung': self.beschreibung,
-            'sprachen': self.get_languages(),
+            'sprachen': self.languages,
             'n_textsorten': len(self.textsorten),
             'n_prozessstrukturen': len(self.prozessstrukturen),
             'n_frames': len(self.frames),
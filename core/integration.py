@@ -14,6 +14,173 @@ Erzeugt:
 Jeder Output ist ein epistemischer Vorschlag, kein Befund.
 """
 
+import heapq
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# Häufig verglichene Agency-Label einmal internen: der ==-Vergleich im
+# Hot Path trifft dann den Identitäts-Shortcut statt zeichenweise zu
+# vergleichen (die Profile speichern ebenfalls die interne Instanz).
+AKTIV_HANDELND = sys.intern('AKTIV_HANDELND')
+ERLEIDEND_PASSIV = sys.intern('ERLEIDEND_PASSIV')
+MORALISCH_REFLEKTIEREND = sys.intern('MORALISCH_REFLEKTIEREND')
+
+# Cross-Module-Flags als Bitmaske: Prädikate in der Triangulation werden
+# zu Bit-Tests statt linearer `in`-Scans über die Flag-Liste.
+FLAG_VERLAUFSKURVE = 1 << 0
+FLAG_WANDLUNG = 1 << 1
+FLAG_AFFEKT_HOCH = 1 << 2
+FLAG_PASSIV = 1 << 3
+FLAG_MULTI_FRAME = 1 << 4
+FLAG_TEXTSORTEN_WECHSEL = 1 << 5
+
+_FLAG_NAMES = (
+    (FLAG_VERLAUFSKURVE, 'VERLAUFSKURVE'),
+    (FLAG_WANDLUNG, 'WANDLUNG'),
+    (FLAG_AFFEKT_HOCH, 'AFFEKT_HOCH'),
+    (FLAG_PASSIV, 'PASSIV'),
+    (FLAG_MULTI_FRAME, 'MULTI_FRAME'),
+    (FLAG_TEXTSORTEN_WECHSEL, 'TEXTSORTEN_WECHSEL'),
+)
+
+
+def _flag_namen(mask):
+    """Lesbare Flag-Namen zu einer Bitmaske (für Berichte/Exporte)."""
+    return [name for bit, name in _FLAG_NAMES if mask & bit]
+
+
+# Geteilte Default-Container für .get-Misses im Profilbau — eine
+# Allokation pro Prozess statt pro Turn. Konsumenten behandeln
+# Profil-Dicts/-Listen als read-only.
+_EMPTY_DICT = {}
+_EMPTY_LIST = []
+
+
+# ── Triangulations-Muster als Tabelle ──────────────────────────────
+# (Prädikat, statisches Template) statt handkodierter if-Leiter: die
+# Template-Dicts entstehen einmal beim Import, nicht pro Turn, und neue
+# Muster sind ein Tabelleneintrag. Templates gelten als unveränderlich.
+
+def _pred_krise(p):
+    """Verlaufskurve + passiv + hoher Affekt."""
+    mask = p.flag_mask
+    return bool(mask & FLAG_VERLAUFSKURVE
+                and (mask & FLAG_PASSIV or p.dominant_agency is ERLEIDEND_PASSIV)
+                and p.affekt_dichte > 2)
+
+
+def _pred_widerstand(p):
+    """Systemkritik + aktive/moralische Agency."""
+    ag = p.dominant_agency
+    return ('SYSTEMVERSAGEN' in p.frame_set
+            and (ag is AKTIV_HANDELND or ag is MORALISCH_REFLEKTIEREND))
+
+
+def _pred_ambivalentes_festhalten(p):
+    """Berufung + Ökonomisierung/Ambivalenz."""
+    return ('BERUFUNG' in p.frame_set
+            and ('OEKONOMISIERUNG' in p.frame_set
+                 or 'AMBIVALENZ' in p.affekt_dim_set))
+
+
+def _pred_narrative_transformation(p):
+    """Wandlung + Textsorten-Wechsel."""
+    return bool(p.flag_mask & FLAG_WANDLUNG and p.n_transitions >= 1)
+
+
+def _pred_verkoerperter_affekt(p):
+    """Hohe Affekt-Dichte + körperliche Verweise."""
+    return p.affekt_dichte > 3 and 'KOERPERLICHER_VERWEIS' in p.affekt_dim_set
+
+
+_MUSTER = (
+    (_pred_krise, {
+        'muster': 'KRISE',
+        'beschreibung': 'Narrative Verlaufskurve + passives Subjekt + hohe affektive Intensität',
+        'module': ['A (Verlaufskurve)', 'B (Erleidend)', 'D (Affekt)'],
+        'prueffrage': 'Handelt es sich um einen biografischen Wendepunkt? '
+                      'Wie wird die Krise narrativ verarbeitet?',
+    }),
+    (_pred_widerstand, {
+        'muster': 'WIDERSTAND',
+        'beschreibung': 'Systemkritik + aktive/moralische Agency',
+        'module': ['B (Agency)', 'C (Systemversagen)'],
+        'prueffrage': 'Positioniert sich die Person als widerständiges Subjekt? '
+                      'Gegen wen/was richtet sich der Widerstand?',
+    }),
+    (_pred_ambivalentes_festhalten, {
+        'muster': 'AMBIVALENTES_FESTHALTEN',
+        'beschreibung': 'Berufungs-Frame + ökonomischer Druck/Ambivalenz',
+        'module': ['C (Berufung + Ökonomisierung)', 'D (Ambivalenz)'],
+        'prueffrage': 'Wie verhandelt die Person den Widerspruch zwischen '
+                      'innerer Überzeugung und äußerem Druck?',
+    }),
+    (_pred_narrative_transformation, {
+        'muster': 'NARRATIVE_TRANSFORMATION',
+        'beschreibung': 'Wandlung + Textsorten-Wechsel → mögliche Umorientierung',
+        'module': ['A (Wandlung)', 'A (Textsorten-Wechsel)'],
+        'prueffrage': 'Ist hier ein Übergang von der Erleidens- zur '
+                      'Handlungsperspektive erkennbar?',
+    }),
+    (_pred_verkoerperter_affekt, {
+        'muster': 'VERKÖRPERTER_AFFEKT',
+        'beschreibung': 'Hohe Affekt-Dichte + körperliche Verweise',
+        'module': ['D (Intensität)', 'D (Körperlichkeit)'],
+        'prueffrage': 'Wird hier etwas ausgedrückt, das sprachlich nicht '
+                      'vollständig sagbar ist? Leibliche Dimension prüfen.',
+    }),
+)
+
+
+@dataclass(slots=True)
+class TurnProfile:
+    """
+    Integriertes Pro-Turn-Profil über alle Module.
+
+    Slots-Dataclass statt 16-Key-Dict: feste Attribut-Slots statt
+    Hash-Table pro Turn (wie Annotation/Turn im Datenmodell).
+    __getitem__/get erhalten den Dict-Zugriff für bestehende Konsumenten
+    (Notebook, Berichte).
+    """
+    turn_id: int
+    n_woerter: int
+    text_vorschau: str
+    # Modul A
+    textsorten_sequenz: str
+    prozessstrukturen: str
+    n_transitions: int
+    # Modul B
+    dominant_agency: str
+    agency_dichte: float
+    pronomen: dict
+    # Modul C
+    dominant_frame: str
+    n_frames_aktiv: int
+    frames: dict
+    # Modul D
+    affekt_dichte: float
+    affekt_dimensionen: list
+    # Integration
+    # `flags` ist nur die Anzeige-Form; Mitgliedschaftstests laufen über
+    # die Bitmaske `flag_mask` (O(1) statt Listen-Scan)
+    flags: list
+    n_flags: int
+    total_annotations: int
+    # Vorab gefrorene Namens-Sets für die Muster-Prädikate
+    frame_set: frozenset = frozenset()
+    affekt_dim_set: frozenset = frozenset()
+    flag_mask: int = 0
+    verdichtung_score: int = 0
+    verdichtung_reasons: list = field(default_factory=list)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 class Integrator:
     """
@@ -30,6 +197,47 @@ class Integrator:
         self.mod_b = mod_b
         self.mod_c = mod_c
         self.mod_d = mod_d
+        # Optionale Claim-Quelle von Modul C einmal auflösen statt
+        # hasattr pro _alle_claims-Aufruf
+        self._mod_c_generate_claims = getattr(mod_c, 'generate_claims', None)
+        # Turn-Profile werden von vier Berichtsteilen gebraucht —
+        # einmal bauen, dann aus dem Cache lesen (siehe invalidate()).
+        self._profile_cache = None
+        # Globale Reduktionen aus dem Profilbau (für die Hypothesen)
+        self._profile_aggregates = None
+        # Modul-Zusammenfassungen (turn_id → Zeile) pro Modul cachen
+        self._summary_cache = {}
+        # 150-Zeichen-Vorschau pro Turn (Turn-Text ist unveränderlich)
+        self._preview_cache = {}
+        # Kompletter vollbericht()-Output samt Versionsstempel
+        self._report_cache = None
+        self._report_cache_ver = None
+
+    def invalidate(self):
+        """Setzt die Caches zurück (nach erneuter Analyse aufrufen)."""
+        self._profile_cache = None
+        self._profile_aggregates = None
+        self._summary_cache.clear()
+        self._preview_cache.clear()
+        self._report_cache = None
+        self._report_cache_ver = None
+
+    def _preview(self, turn):
+        """Text-Vorschau eines Turns (memoisiert — keine Slice-Allokation
+        pro Profilbau)."""
+        v = self._preview_cache.get(turn.turn_id)
+        if v is None:
+            v = self._preview_cache[turn.turn_id] = turn.text[:150]
+        return v
+
+    def _summary(self, mod):
+        """Turn-Zusammenfassung eines Moduls als turn_id-Dict (memoisiert)."""
+        key = id(mod)
+        cached = self._summary_cache.get(key)
+        if cached is None:
+            cached = {r['turn_id']: r for r in mod.zusammenfassung(self.doc)}
+            self._summary_cache[key] = cached
+        return cached
     
     def vollbericht(self):
         """
@@ -43,86 +251,151 @@ class Integrator:
                 - hypothesen: Formulierte Prüffragen
                 - claims: Alle Claims aus allen Modulen
         """
-        return {
+        # Kompletten Bericht cachen; wie bei den Lazy-Indizes im
+        # Datenmodell dient die Annotation-Zahl als Staleness-Guard
+        # (neue Analyse → Zahl ändert sich → Neuaufbau).
+        ver = (id(self.doc), len(self.doc.annotations))
+        if self._report_cache is not None and self._report_cache_ver == ver:
+            return self._report_cache
+
+        self.invalidate()
+        self._report_cache = {
             'turn_profile': self._turn_profile(),
             'verdichtungsstellen': self._verdichtungsstellen(),
             'triangulationen': self._triangulieren(),
             'hypothesen': self._hypothesen_generieren(),
             'claims': self._alle_claims(),
         }
+        self._report_cache_ver = ver
+        return self._report_cache
     
     # ================================================================
     # TURN PROFILE – Alles auf einen Blick pro Turn
     # ================================================================
     
     def _turn_profile(self):
-        """Integriertes Profil pro Turn mit allen Modulen."""
+        """Integriertes Profil pro Turn (memoisiert, s. invalidate())."""
+        if self._profile_cache is None:
+            self._profile_cache = self._build_turn_profile()
+        return self._profile_cache
+
+    def _build_turn_profile(self):
+        """
+        Baut das integrierte Profil pro Turn mit allen Modulen.
+
+        Nebenbei werden die globalen Aggregate für die Hypothesen
+        (Frame-Summen, Affekt-Verlauf, Agency-Positionen) im selben
+        Durchlauf gefüllt — ein Pass statt erneuter Profil-Iteration.
+        """
         profiles = []
+        # Spaltenlayout für die Hypothesen-Mathematik: statt später die
+        # Record-Liste zu durchlaufen (ein Attribut-Zugriff pro Feld pro
+        # Turn), liegen die drei gebrauchten Spalten hier als eigene
+        # Strukturen vor.
+        aggregate = {
+            'alle_frames': Counter(),
+            'affekt_werte': [],
+            'aktiv_sum': 0, 'aktiv_n': 0,
+            'passiv_sum': 0, 'passiv_n': 0,
+        }
+        self._profile_aggregates = aggregate
         
-        a_summary = {r['turn_id']: r for r in self.mod_a.zusammenfassung(self.doc)}
-        b_summary = {r['turn_id']: r for r in self.mod_b.zusammenfassung(self.doc)}
-        c_summary = {r['turn_id']: r for r in self.mod_c.zusammenfassung(self.doc)}
-        d_summary = {r['turn_id']: r for r in self.mod_d.zusammenfassung(self.doc)}
-        
+        # Fehlende Modul-Zusammenfassungen parallel berechnen — die vier
+        # Module sind unabhängig und lesen das Document nur; bei warmem
+        # Cache (wiederholter Bericht) wird der Pool gar nicht gestartet.
+        mods = (self.mod_a, self.mod_b, self.mod_c, self.mod_d)
+        fehlend = [m for m in mods if id(m) not in self._summary_cache]
+        if len(fehlend) > 1:
+            with ThreadPoolExecutor(max_workers=len(fehlend)) as ex:
+                futures = [(m, ex.submit(m.zusammenfassung, self.doc))
+                           for m in fehlend]
+                for m, future in futures:
+                    self._summary_cache[id(m)] = {
+                        r['turn_id']: r for r in future.result()}
+
+        a_summary = self._summary(self.mod_a)
+        b_summary = self._summary(self.mod_b)
+        c_summary = self._summary(self.mod_c)
+        d_summary = self._summary(self.mod_d)
+
+        # Annotation-Zahl pro Turn in EINEM Pass statt get_annotations-
+        # Filter (O(A)) pro Turn
+        ann_counts = Counter(a.turn_id for a in self.doc.annotations)
+
         for turn in self.doc.get_befragte_turns():
             tid = turn.turn_id
             
-            a = a_summary.get(tid, {})
-            b = b_summary.get(tid, {})
-            c = c_summary.get(tid, {})
-            d = d_summary.get(tid, {})
-            
-            # Flags sammeln
-            flags = []
+            a = a_summary.get(tid, _EMPTY_DICT)
+            b = b_summary.get(tid, _EMPTY_DICT)
+            c = c_summary.get(tid, _EMPTY_DICT)
+            d = d_summary.get(tid, _EMPTY_DICT)
             
+            # Flags als Bitmaske sammeln
+            mask = 0
+
             # Verlaufskurve erkannt?
             if 'VERLAUFSKURVE' in a.get('prozessstrukturen', ''):
-                flags.append('VERLAUFSKURVE')
+                mask |= FLAG_VERLAUFSKURVE
             if 'WANDLUNG' in a.get('prozessstrukturen', ''):
-                flags.append('WANDLUNG')
-            
+                mask |= FLAG_WANDLUNG
+
             # Hohe affektive Intensität?
             if d.get('marker_dichte', 0) > 5:
-                flags.append('AFFEKT_HOCH')
-            
+                mask |= FLAG_AFFEKT_HOCH
+
             # Erleidend/passiv?
-            if b.get('dominant_agency') == 'ERLEIDEND_PASSIV':
-                flags.append('PASSIV')
-            
+            if b.get('dominant_agency') == ERLEIDEND_PASSIV:
+                mask |= FLAG_PASSIV
+
             # Mehrere Frames aktiv?
             if c.get('n_frames_aktiv', 0) >= 3:
-                flags.append('MULTI_FRAME')
-            
+                mask |= FLAG_MULTI_FRAME
+
             # Textsorten-Wechsel?
             if a.get('n_transitions', 0) >= 2:
-                flags.append('TEXTSORTEN_WECHSEL')
+                mask |= FLAG_TEXTSORTEN_WECHSEL
+
+            # Namensliste nur für Berichte/Exporte
+            flags = _flag_namen(mask)
             
-            profile = {
-                'turn_id': tid,
-                'n_woerter': turn.n_woerter,
-                'text_vorschau': turn.text[:150],
+            profile = TurnProfile(
+                turn_id=tid,
+                n_woerter=turn.n_woerter,
+                text_vorschau=self._preview(turn),
                 # Modul A
-                'textsorten_sequenz': a.get('sequenz_kurz', ''),
-                'prozessstrukturen': a.get('prozessstrukturen', '-'),
-                'n_transitions': a.get('n_transitions', 0),
+                textsorten_sequenz=a.get('sequenz_kurz', ''),
+                prozessstrukturen=a.get('prozessstrukturen', '-'),
+                n_transitions=a.get('n_transitions', 0),
                 # Modul B
-                'dominant_agency': b.get('dominant_agency', '-'),
-                'agency_dichte': b.get('agency_dichte', 0),
-                'pronomen': b.get('pronomen', {}),
+                dominant_agency=sys.intern(b.get('dominant_agency', '-')),
+                agency_dichte=b.get('agency_dichte', 0),
+                pronomen=b.get('pronomen', _EMPTY_DICT),
                 # Modul C
-                'dominant_frame': c.get('dominant_frame', '-'),
-                'n_frames_aktiv': c.get('n_frames_aktiv', 0),
-                'frames': c.get('frames', {}),
+                dominant_frame=c.get('dominant_frame', '-'),
+                n_frames_aktiv=c.get('n_frames_aktiv', 0),
+                frames=c.get('frames', _EMPTY_DICT),
                 # Modul D
-                'affekt_dichte': d.get('marker_dichte', 0),
-                'affekt_dimensionen': d.get('aktive_dimensionen', []),
+                affekt_dichte=d.get('marker_dichte', 0),
+                affekt_dimensionen=d.get('aktive_dimensionen', _EMPTY_LIST),
                 # Integration
-                'flags': flags,
-                'n_flags': len(flags),
-                'total_annotations': len(self.doc.get_annotations(turn_id=tid)),
-            }
+                flags=flags,
+                n_flags=len(flags),
+                total_annotations=ann_counts.get(tid, 0),
+                frame_set=frozenset(c.get('frames', ())),
+                affekt_dim_set=frozenset(d.get('aktive_dimensionen', ())),
+                flag_mask=mask,
+            )
+            aggregate['alle_frames'].update(profile.frames)
+            aggregate['affekt_werte'].append(profile.affekt_dichte)
+            if profile.dominant_agency is AKTIV_HANDELND:
+                aggregate['aktiv_sum'] += len(profiles)
+                aggregate['aktiv_n'] += 1
+            elif profile.dominant_agency is ERLEIDEND_PASSIV:
+                aggregate['passiv_sum'] += len(profiles)
+                aggregate['passiv_n'] += 1
+
             profiles.append(profile)
-        
+
         return profiles
     
     # ================================================================
@@ -145,39 +418,40 @@ class Integrator:
         for p in profiles:
             score = 0
             reasons = []
-            
+
             # Flags (stärkstes Signal)
-            score += p['n_flags'] * 3
-            if p['flags']:
-                reasons.append(f"Flags: {', '.join(p['flags'])}")
-            
+            score += p.n_flags * 3
+            if p.flags:
+                reasons.append(f"Flags: {', '.join(p.flags)}")
+
             # Affektive Intensität
-            if p['affekt_dichte'] > 5:
+            if p.affekt_dichte > 5:
                 score += 3
-                reasons.append(f"Hohe Affekt-Dichte: {p['affekt_dichte']}%")
-            elif p['affekt_dichte'] > 2:
+                reasons.append(f"Hohe Affekt-Dichte: {p.affekt_dichte}%")
+            elif p.affekt_dichte > 2:
                 score += 1
-            
+
             # Frame-Komplexität
-            if p['n_frames_aktiv'] >= 3:
+            if p.n_frames_aktiv >= 3:
                 score += 2
-                reasons.append(f"{p['n_frames_aktiv']} Frames aktiv")
-            
+                reasons.append(f"{p.n_frames_aktiv} Frames aktiv")
+
             # Textsorten-Wechsel
-            if p['n_transitions'] >= 2:
+            if p.n_transitions >= 2:
                 score += 2
-                reasons.append(f"{p['n_transitions']} Textsorten-Wechsel")
-            
+                reasons.append(f"{p.n_transitions} Textsorten-Wechsel")
+
             # Prozessstruktur
-            if p['prozessstrukturen'] != '-':
+            if p.prozessstrukturen != '-':
                 score += 2
-                reasons.append(f"Prozessstruktur: {p['prozessstrukturen']}")
-            
-            p['verdichtung_score'] = score
-            p['verdichtung_reasons'] = reasons
-        
-        profiles.sort(key=lambda x: -x['verdichtung_score'])
-        return profiles[:n]
+                reasons.append(f"Prozessstruktur: {p.prozessstrukturen}")
+
+            p.verdichtung_score = score
+            p.verdichtung_reasons = reasons
+
+        # Top-N per Heap (O(T log n) statt Vollsortierung); die gecachte
+        # Profil-Liste bleibt dabei in Turn-Reihenfolge
+        return heapq.nlargest(n, profiles, key=lambda x: x.verdichtung_score)
     
     # ================================================================
     # TRIANGULATION – Wo stimmen Module überein?
@@ -193,84 +467,19 @@ class Integrator:
         """
         triangulationen = []
         profiles = self._turn_profile()
-        
+
         for p in profiles:
-            tid = p['turn_id']
-            muster = []
-            
-            # Muster 1: KRISE
-            # Verlaufskurve + passiv + hoher Affekt
-            is_krise = (
-                'VERLAUFSKURVE' in p['flags'] and
-                ('PASSIV' in p['flags'] or p['dominant_agency'] == 'ERLEIDEND_PASSIV') and
-                p['affekt_dichte'] > 2
-            )
-            if is_krise:
-                muster.append({
-                    'muster': 'KRISE',
-                    'beschreibung': 'Narrative Verlaufskurve + passives Subjekt + hohe affektive Intensität',
-                    'module': ['A (Verlaufskurve)', 'B (Erleidend)', 'D (Affekt)'],
-                    'prueffrage': 'Handelt es sich um einen biografischen Wendepunkt? '
-                                 'Wie wird die Krise narrativ verarbeitet?',
-                })
-            
-            # Muster 2: WIDERSTAND
-            # Systemkritik + aktive Agency + moralische Positionierung
-            has_systemkritik = 'SYSTEMVERSAGEN' in p.get('frames', {})
-            is_aktiv = p['dominant_agency'] == 'AKTIV_HANDELND' or p['dominant_agency'] == 'MORALISCH_REFLEKTIEREND'
-            if has_systemkritik and is_aktiv:
-                muster.append({
-                    'muster': 'WIDERSTAND',
-                    'beschreibung': 'Systemkritik + aktive/moralische Agency',
-                    'module': ['B (Agency)', 'C (Systemversagen)'],
-                    'prueffrage': 'Positioniert sich die Person als widerständiges Subjekt? '
-                                 'Gegen wen/was richtet sich der Widerstand?',
-                })
-            
-            # Muster 3: AMBIVALENTES FESTHALTEN
-            # Berufung + Ökonomisierung + Ambivalenz-Affekt
-            has_berufung = 'BERUFUNG' in p.get('frames', {})
-            has_oeko = 'OEKONOMISIERUNG' in p.get('frames', {})
-            has_ambivalenz = 'AMBIVALENZ' in p.get('affekt_dimensionen', [])
-            if has_berufung and (has_oeko or has_ambivalenz):
-                muster.append({
-                    'muster': 'AMBIVALENTES_FESTHALTEN',
-                    'beschreibung': 'Berufungs-Frame + ökonomischer Druck/Ambivalenz',
-                    'module': ['C (Berufung + Ökonomisierung)', 'D (Ambivalenz)'],
-                    'prueffrage': 'Wie verhandelt die Person den Widerspruch zwischen '
-                                 'innerer Überzeugung und äußerem Druck?',
-                })
-            
-            # Muster 4: NARRATIVE TRANSFORMATION
-            # Wandlung + Frame-Wechsel + Textsorten-Wechsel
-            has_wandlung = 'WANDLUNG' in p['flags']
-            has_wechsel = p['n_transitions'] >= 1
-            if has_wandlung and has_wechsel:
-                muster.append({
-                    'muster': 'NARRATIVE_TRANSFORMATION',
-                    'beschreibung': 'Wandlung + Textsorten-Wechsel → mögliche Umorientierung',
-                    'module': ['A (Wandlung)', 'A (Textsorten-Wechsel)'],
-                    'prueffrage': 'Ist hier ein Übergang von der Erleidens- zur '
-                                 'Handlungsperspektive erkennbar?',
-                })
-            
-            # Muster 5: AFFEKTIVE VERDICHTUNG + KÖRPER
-            has_koerper = 'KOERPERLICHER_VERWEIS' in p.get('affekt_dimensionen', [])
-            if has_koerper and p['affekt_dichte'] > 3:
-                muster.append({
-                    'muster': 'VERKÖRPERTER_AFFEKT',
-                    'beschreibung': 'Hohe Affekt-Dichte + körperliche Verweise',
-                    'module': ['D (Intensität)', 'D (Körperlichkeit)'],
-                    'prueffrage': 'Wird hier etwas ausgedrückt, das sprachlich nicht '
-                                 'vollständig sagbar ist? Leibliche Dimension prüfen.',
-                })
-            
+            # Daten-getriebene Muster-Tabelle: Templates sind statisch
+            # (siehe _MUSTER) und werden nur referenziert, nicht pro
+            # Turn neu alloziert.
+            muster = [tpl for pred, tpl in _MUSTER if pred(p)]
+
             if muster:
                 triangulationen.append({
-                    'turn_id': tid,
+                    'turn_id': p.turn_id,
                     'muster': muster,
                     'n_muster': len(muster),
-                    'text_vorschau': p['text_vorschau'],
+                    'text_vorschau': p.text_vorschau,
                 })
         
         # Nach Anzahl der Muster sortieren
@@ -284,9 +493,13 @@ class Integrator:
     def _hypothesen_generieren(self):
         """
         Generiert übergreifende Hypothesen aus dem Gesamtbild.
-        
+
         NICHT: "Das Interview zeigt X."
         SONDERN: "Es gibt Hinweise auf X. Prüfe anhand von Y."
+
+        Liest ausschließlich die beim Profilbau gefüllten Aggregate —
+        hier wird keine Profil-Liste mehr materialisiert oder erneut
+        durchlaufen.
         """
         hypothesen = []
         profiles = self._turn_profile()
@@ -294,16 +507,14 @@ class Integrator:
         if not profiles:
             return hypothesen
         
+        # Aggregate wurden beim Profilbau im selben Pass gefüllt
+        agg = self._profile_aggregates
+
         # 1. Gesamtdynamik: Handeln → Erleiden oder umgekehrt?
-        agency_verlauf = [p['dominant_agency'] for p in profiles]
-        
-        aktiv_indices = [i for i, a in enumerate(agency_verlauf) if a == 'AKTIV_HANDELND']
-        passiv_indices = [i for i, a in enumerate(agency_verlauf) if a == 'ERLEIDEND_PASSIV']
-        
-        if aktiv_indices and passiv_indices:
-            avg_aktiv = sum(aktiv_indices) / len(aktiv_indices)
-            avg_passiv = sum(passiv_indices) / len(passiv_indices)
-            
+        if agg['aktiv_n'] and agg['passiv_n']:
+            avg_aktiv = agg['aktiv_sum'] / agg['aktiv_n']
+            avg_passiv = agg['passiv_sum'] / agg['passiv_n']
+
             if avg_aktiv < avg_passiv:
                 hypothesen.append({
                     'hypothese': 'Das Interview zeigt eine mögliche Verlaufskurve: '
@@ -323,37 +534,38 @@ class Integrator:
                 })
         
         # 2. Frame-Dominanz und ihre Implikationen
-        alle_frames = {}
-        for p in profiles:
-            for f, c in p.get('frames', {}).items():
-                alle_frames[f] = alle_frames.get(f, 0) + c
-        
+        alle_frames = agg['alle_frames']
+
         if alle_frames:
-            dominant = max(alle_frames, key=alle_frames.get)
+            # Ein Scan über die Items statt max(dict, key=dict.get)
+            # (das läuft zweimal über den Hash-Table)
+            dominant, dominant_cnt = max(alle_frames.items(), key=lambda kv: kv[1])
             total = sum(alle_frames.values())
-            pct = alle_frames[dominant] / total * 100 if total > 0 else 0
-            
+            pct = dominant_cnt / total * 100 if total > 0 else 0
+
             if pct > 35:
                 hypothesen.append({
                     'hypothese': f"Der Frame '{dominant}' dominiert das Interview ({pct:.0f}%). "
                                 f"Dies könnte der zentrale Deutungsrahmen der befragten Person sein.",
-                    'evidenz': f"Frame-Verteilung: {alle_frames}",
+                    'evidenz': f"Frame-Verteilung: {dict(alle_frames)}",
                     'prueffrage': f"Ist '{dominant}' eine genuine Deutung der Person oder "
                                  f"ein Effekt der Interviewführung/Fragestellung?",
                     'zu_pruefen': 'Kommt der Frame in Antworten auf verschiedene Fragen vor?',
                 })
         
         # 3. Affektive Gesamtdynamik
-        affekt_werte = [p['affekt_dichte'] for p in profiles]
+        affekt_werte = agg['affekt_werte']
         if affekt_werte:
-            max_idx = affekt_werte.index(max(affekt_werte))
-            max_turn = profiles[max_idx]['turn_id']
+            # argmax in einem Pass statt max() + list.index()
+            max_idx, _ = max(enumerate(affekt_werte), key=lambda x: x[1])
+            max_turn = profiles[max_idx].turn_id
             
             # Steigt oder fällt die Intensität?
             if len(affekt_werte) >= 3:
-                erste_haelfte = sum(affekt_werte[:len(affekt_werte)//2])
-                zweite_haelfte = sum(affekt_werte[len(affekt_werte)//2:])
-                
+                half = len(affekt_werte) // 2
+                erste_haelfte = sum(affekt_werte[:half])
+                zweite_haelfte = sum(affekt_werte[half:])
+
                 if zweite_haelfte > erste_haelfte * 1.5:
                     hypothesen.append({
                         'hypothese': 'Die affektive Intensität nimmt im Interviewverlauf zu. '
@@ -388,9 +600,9 @@ class Integrator:
                              'in der biografischen Erzählung?',
             })
         
-        # Modul C: Claims
-        if hasattr(self.mod_c, 'generate_claims'):
-            for claim in self.mod_c.generate_claims(self.doc):
+        # Modul C: Claims (Methode wurde im __init__ aufgelöst)
+        if self._mod_c_generate_claims is not None:
+            for claim in self._mod_c_generate_claims(self.doc):
                 claim['modul'] = 'C_diskurs'
                 claims.append(claim)
         
@@ -416,57 +628,69 @@ class Integrator:
     # ================================================================
     
     def print_bericht(self):
-        """Druckt einen lesbaren Gesamtbericht."""
+        """
+        Druckt einen lesbaren Gesamtbericht.
+
+        Die Zeilen werden in einer Liste gesammelt und als EIN
+        stdout-write ausgegeben — statt dutzender print-Aufrufe mit
+        je eigenem Lock/Flush pro Zeile.
+        """
         report = self.vollbericht()
-        
-        print("=" * 72)
-        print("   INTEGRIERTER ANALYSEBERICHT")
-        print("   Epistemischer Status: Vorschläge zur Prüfung")
-        print("=" * 72)
-        
+
+        sep72 = "=" * 72
+        sep40 = "-" * 40
+        out = []
+
+        out.append(sep72)
+        out.append("   INTEGRIERTER ANALYSEBERICHT")
+        out.append("   Epistemischer Status: Vorschläge zur Prüfung")
+        out.append(sep72)
+
         # 1. Verdichtungsstellen
-        print("\n📍 TOP VERDICHTUNGSSTELLEN")
-        print("-" * 40)
+        out.append("\n📍 TOP VERDICHTUNGSSTELLEN")
+        out.append(sep40)
         for v in report['verdichtungsstellen']:
-            print(f"\n  Turn {v['turn_id']} (Score: {v['verdichtung_score']})")
-            for r in v['verdichtung_reasons']:
-                print(f"    → {r}")
-            print(f"    Text: {v['text_vorschau'][:120]}...")
-        
+            out.append(f"\n  Turn {v.turn_id} (Score: {v.verdichtung_score})")
+            for r in v.verdichtung_reasons:
+                out.append(f"    → {r}")
+            out.append(f"    Text: {v.text_vorschau}...")
+
         # 2. Triangulationen
         if report['triangulationen']:
-            print(f"\n\n🔺 TRIANGULATIONEN (Cross-Module-Muster)")
-            print("-" * 40)
+            out.append(f"\n\n🔺 TRIANGULATIONEN (Cross-Module-Muster)")
+            out.append(sep40)
             for tri in report['triangulationen']:
-                print(f"\n  Turn {tri['turn_id']}:")
+                out.append(f"\n  Turn {tri['turn_id']}:")
                 for m in tri['muster']:
-                    print(f"    ⚡ {m['muster']}: {m['beschreibung']}")
-                    print(f"       Module: {', '.join(m['module'])}")
-                    print(f"       ❓ {m['prueffrage']}")
-        
+                    out.append(f"    ⚡ {m['muster']}: {m['beschreibung']}")
+                    out.append(f"       Module: {', '.join(m['module'])}")
+                    out.append(f"       ❓ {m['prueffrage']}")
+
         # 3. Claims
         if report['claims']:
-            print(f"\n\n📋 CLAIMS ({len(report['claims'])} gesamt)")
-            print("-" * 40)
+            out.append(f"\n\n📋 CLAIMS ({len(report['claims'])} gesamt)")
+            out.append(sep40)
             for i, c in enumerate(report['claims'][:8]):
                 modul = c.get('modul', '?')
-                print(f"\n  [{i+1}] [{modul}] {c['typ']}")
-                print(f"      {c['beschreibung']}")
-                print(f"      Evidenz: {c['evidenz'][:120]}")
-                print(f"      ❓ {c['prueffrage']}")
-        
+                out.append(f"\n  [{i+1}] [{modul}] {c['typ']}")
+                out.append(f"      {c['beschreibung']}")
+                out.append(f"      Evidenz: {c['evidenz'][:120]}")
+                out.append(f"      ❓ {c['prueffrage']}")
+
         # 4. Hypothesen
         if report['hypothesen']:
-            print(f"\n\n🧠 HYPOTHESEN")
-            print("-" * 40)
+            out.append(f"\n\n🧠 HYPOTHESEN")
+            out.append(sep40)
             for h in report['hypothesen']:
-                print(f"\n  H: {h['hypothese']}")
-                print(f"     Evidenz: {h['evidenz']}")
-                print(f"     ❓ {h['prueffrage']}")
-                print(f"     Zu prüfen: {h['zu_pruefen']}")
-        
-        print("\n" + "=" * 72)
-        print("⚠️  Alle Befunde sind epistemische Vorschläge.")
-        print("   Sie ersetzen nicht die qualitative Interpretation.")
-        print("   Prüfe die markierten Stellen im Originaltranskript.")
-        print("=" * 72)
+                out.append(f"\n  H: {h['hypothese']}")
+                out.append(f"     Evidenz: {h['evidenz']}")
+                out.append(f"     ❓ {h['prueffrage']}")
+                out.append(f"     Zu prüfen: {h['zu_pruefen']}")
+
+        out.append("\n" + sep72)
+        out.append("⚠️  Alle Befunde sind epistemische Vorschläge.")
+        out.append("   Sie ersetzen nicht die qualitative Interpretation.")
+        out.append("   Prüfe die markierten Stellen im Originaltranskript.")
+        out.append(sep72)
+
+        sys.stdout.write("\n".join(out) + "\n")
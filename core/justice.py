@@ -20,8 +20,10 @@ Epistemischer Status:
     Alle Outputs sind Vorschläge zur Prüfung, keine Befunde.
 """
 
+import heapq
+import sys
+from dataclasses import dataclass
 from math import sqrt
-from collections import defaultdict
 
 
 # ════════════════════════════════════════════════════════
@@ -84,6 +86,54 @@ def _axis_label(a_frame, s_frame):
     return AXIS_LABELS.get(key, f"{a_frame} × {s_frame}")
 
 
+@dataclass(slots=True)
+class JusticeTurnProfile:
+    """
+    Spannungsprofil eines Turns.
+
+    Slots-Dataclass statt ~17-Key-Dict: festes Layout, schnellerer
+    Attributzugriff, deutlich kleinerer Fußabdruck pro Turn.
+    """
+    turn_id: int
+    a_frames: dict
+    s_frames: dict
+    a_total: int
+    s_total: int
+    basis: float
+    affekt_mult: float
+    agency_mult: float
+    agency_label: str
+    k_mult: float
+    k_frames: list
+    intensity: float
+    intensity_norm: float
+    tension_axes: list
+    overlay_tags: tuple
+    is_justice_site: bool
+    text_preview: str
+    # Wird in interview_profil nach dem P75-Schwellwert gesetzt
+    is_justice_site_strong: bool = False
+
+    # Dict-Zugriff für bestehende Aufrufer (z.B. Demo-Notebook)
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+# Turn-Detail-Block für print_profil: ein format()-Aufruf pro Turn
+# statt vier verketteter f-Strings mit je mehreren Feldzugriffen.
+_TURN_TMPL = (
+    "\n  Turn {p.turn_id}{strong}{tags}\n"
+    "    A-Frames: {p.a_frames}\n"
+    "    S-Frames: {p.s_frames}\n"
+    "    Basis: {p.basis} × Affekt {p.affekt_mult} "
+    "× Agency {p.agency_mult} ({p.agency_label}) × K {p.k_mult}\n"
+    "    → Intensität: {p.intensity} ({p.intensity_norm}/1000z)"
+)
+
+
 class JusticeAnalyzer:
     """
     Berechnet (Un)Gerechtigkeits-Spannungsprofile aus den
@@ -128,9 +178,66 @@ class JusticeAnalyzer:
                              self.k_frames_verst | self.k_frames_daempf |
                              self.k_frames_neutral)
 
+        # Frame → Bucket ('a'/'s'/'kv'/'kd'/'kn') für die Ein-Pass-
+        # Klassifikation in turn_profiles; Frames ohne Eintrag sind
+        # Overlay-Tags. Ersetzt auch die frühere K-Union pro Turn samt
+        # verst/daempf-Membership-Tests — der Bucket kodiert das Vorzeichen.
+        self._frame_bucket = {}
+        for bucket, frame_set in (('a', self.a_frames),
+                                  ('s', self.s_frames),
+                                  ('kv', self.k_frames_verst),
+                                  ('kd', self.k_frames_daempf),
+                                  ('kn', self.k_frames_neutral)):
+            for f in frame_set:
+                self._frame_bucket[f] = bucket
+
+        # Achsen-Labels für alle A×S-Paare einmal auflösen — inklusive
+        # der f-String-Fallbacks, die _axis_label sonst pro Aufruf baut.
+        self._axis_labels = {(a, s): _axis_label(a, s)
+                             for a in self.a_frames
+                             for s in self.s_frames}
+
         # Vorberechnung
         self._turn_profiles = None
         self._interview_profil = None
+        # Modul-Ergebnisse (B/C-Zusammenfassung, D-Verdichtung) cachen —
+        # deterministisch pro Dokument, teuer pro Aufruf
+        self._mod_cache = {}
+
+        # Textvorschau und -länge einmal pro Turn materialisieren —
+        # Slicing erzeugt sonst bei jedem Zugriff einen frischen String.
+        self._turn_meta = {t.turn_id: (t.text[:120], max(len(t.text), 1))
+                           for t in self.doc.get_befragte_turns()}
+
+    def _b_summary(self):
+        """Modul-B-Zusammenfassung als turn_id-Dict (memoisiert)."""
+        if 'b' not in self._mod_cache:
+            self._mod_cache['b'] = {
+                r['turn_id']: r for r in self.mod_b.zusammenfassung(self.doc)}
+        return self._mod_cache['b']
+
+    def _c_summary(self):
+        """Modul-C-Zusammenfassung als turn_id-Dict (memoisiert)."""
+        if 'c' not in self._mod_cache:
+            self._mod_cache['c'] = {
+                r['turn_id']: r for r in self.mod_c.zusammenfassung(self.doc)}
+        return self._mod_cache['c']
+
+    def _d_sites(self):
+        """Modul-D-Affektdichte pro turn_id als float (memoisiert).
+
+        Prozent-Strings ("9.5%") werden hier EINMAL beim Aufbau geparst
+        statt pro Turn im Hot-Loop von turn_profiles.
+        """
+        if 'd' not in self._mod_cache:
+            sites = {}
+            for s in self.mod_d.verdichtungsstellen(self.doc):
+                md = s.get('marker_dichte', 0)
+                if isinstance(md, str):
+                    md = float(md.replace('%', ''))
+                sites[s['turn_id']] = md
+            self._mod_cache['d'] = sites
+        return self._mod_cache['d']
 
     # ════════════════════════════════════════════════════
     # Turn-Level Analyse
@@ -141,12 +248,15 @@ class JusticeAnalyzer:
         if self._turn_profiles is not None:
             return self._turn_profiles
 
-        # Hole Zusammenfassungen der Module
-        c_summary = {r['turn_id']: r for r in self.mod_c.zusammenfassung(self.doc)}
-        b_summary = {r['turn_id']: r for r in self.mod_b.zusammenfassung(self.doc)}
-        d_sites = {}
-        for s in self.mod_d.verdichtungsstellen(self.doc):
-            d_sites[s['turn_id']] = s
+        # Hole Zusammenfassungen der Module (memoisiert)
+        c_summary = self._c_summary()
+        b_summary = self._b_summary()
+        d_sites = self._d_sites()
+
+        # Builtin-Lookup aus dem Achsen-Loop hoisten (LOAD_GLOBAL →
+        # LOAD_FAST). Die Halb-gerade-Rundung von round() bleibt bewusst
+        # erhalten — integer-skalierte Varianten änderten Outputs.
+        _round = round
 
         profiles = []
         for turn in self.doc.get_befragte_turns():
@@ -155,34 +265,55 @@ class JusticeAnalyzer:
             b_row = b_summary.get(tid, {})
             frames = c_row.get('frames', {})
 
-            # A- und S-Frame-Counts separieren
-            a_counts = {f: c for f, c in frames.items() if f in self.a_frames}
-            s_counts = {f: c for f, c in frames.items() if f in self.s_frames}
+            # Fast-Path: ohne A- UND S-Frames gibt es keine Spannung —
+            # K-Moderatoren, Wurzeln und Intensitätsarithmetik entfallen;
+            # nur die Counts fürs leere Profil werden noch gesammelt.
+            fk = frames.keys()
+            if not (fk & self.a_frames) or not (fk & self.s_frames):
+                a_counts, s_counts, overlay_tags = {}, {}, {}
+                for f, c in frames.items():
+                    bucket = self._frame_bucket.get(f)
+                    if bucket == 'a':
+                        a_counts[f] = c
+                    elif bucket == 's':
+                        s_counts[f] = c
+                    elif bucket is None:
+                        overlay_tags[f] = c
+                profiles.append(self._empty_profile(tid, turn, a_counts,
+                                                     s_counts, overlay_tags))
+                continue
+
+            # Frames in EINEM Pass klassifizieren (Bucket-Lookup statt
+            # drei Comprehensions plus Set-Schnitt über dieselben Items);
+            # der K-Multiplikator fällt dabei gleich mit ab.
+            a_counts = {}
+            s_counts = {}
+            overlay_tags = {}
+            k_frames_present = []
+            k_mult = 1.0
+            for f, c in frames.items():
+                bucket = self._frame_bucket.get(f)
+                if bucket == 'a':
+                    a_counts[f] = c
+                elif bucket == 's':
+                    s_counts[f] = c
+                elif bucket == 'kv':
+                    k_frames_present.append(f)
+                    k_mult *= 1.10
+                elif bucket == 'kd':
+                    k_frames_present.append(f)
+                    k_mult *= 0.90
+                elif bucket is None:
+                    overlay_tags[f] = c
             a_total = sum(a_counts.values())
             s_total = sum(s_counts.values())
 
-            # K-Frame-Flags
-            k_frames_present = set(frames.keys()) & (
-                self.k_frames_verst | self.k_frames_daempf)
-
-            # Overlay-Tags: Frames die nicht in Meta-Klassifikation sind
-            overlay_tags = {f: c for f, c in frames.items()
-                           if f not in self._meta_frames}
-
             # ── Basis-Spannung ──
+            # (nach dem Fast-Path garantiert > 0: beide Seiten belegt)
             basis = sqrt(a_total * s_total)
 
-            if basis == 0:
-                profiles.append(self._empty_profile(tid, turn, a_counts,
-                                                     s_counts, overlay_tags))
-                continue
-
             # ── Affekt-Multiplikator (Modul D) ──
-            d_info = d_sites.get(tid, {})
-            affekt_dichte = d_info.get('marker_dichte', 0)
-            if isinstance(affekt_dichte, str):
-                # manchmal als "9.5%" formatiert
-                affekt_dichte = float(affekt_dichte.replace('%', ''))
+            affekt_dichte = d_sites.get(tid, 0.0)
             affekt_mult = min(1.0 + affekt_dichte / 100, 1.25)
 
             # ── Agency-Multiplikator (Modul B) ──
@@ -194,79 +325,81 @@ class JusticeAnalyzer:
             else:
                 agency_mult = 1.0
 
-            # ── K-Frame-Moderatoren ──
-            k_mult = 1.0
-            for kf in k_frames_present:
-                if kf in self.k_frames_verst:
-                    k_mult *= 1.10
-                elif kf in self.k_frames_daempf:
-                    k_mult *= 0.90
-
             # ── Intensität ──
             intensity = basis * affekt_mult * agency_mult * k_mult
 
             # Normiert auf 1000 Zeichen
-            text_len = max(len(turn.text), 1)
+            text_preview, text_len = self._turn_meta[tid]
             intensity_norm = intensity / (text_len / 1000)
 
             # ── Spannungsachsen ──
+            # Outer-Product-Faktorisierung: sqrt(ac·sc) = sqrt(ac)·sqrt(sc),
+            # also |A|+|S| Wurzeln statt |A|·|S|; der Multiplikator und die
+            # Overlay-Liste werden einmal pro Turn gebaut und geteilt.
+            # (Die eine skalare Wurzel für `basis` oben bleibt bewusst —
+            # Batching lohnt erst ab mehreren Aufrufen pro Turn.)
+            mult = affekt_mult * agency_mult * k_mult
+            # Ein unveränderliches Tupel pro Turn, von allen Achsen und
+            # dem Profil geteilt — statt einer frischen Liste pro Paar.
+            overlay_shared = tuple(overlay_tags)
+            a_roots = [(af, sqrt(ac) * mult) for af, ac in a_counts.items()]
+            s_roots = [(sf, sqrt(sc)) for sf, sc in s_counts.items()]
             tension_axes = []
-            for af, ac in a_counts.items():
-                for sf, sc in s_counts.items():
-                    axis_intensity = sqrt(ac * sc) * affekt_mult * agency_mult * k_mult
+            for af, ra in a_roots:
+                for sf, rs in s_roots:
                     tension_axes.append({
                         'a_frame': af,
                         's_frame': sf,
-                        'label': _axis_label(af, sf),
-                        'intensity': round(axis_intensity, 2),
-                        'overlay_tags': list(overlay_tags.keys()),
+                        'label': self._axis_labels[(af, sf)],
+                        'intensity': _round(ra * rs, 2),
+                        'overlay_tags': overlay_shared,
                     })
             tension_axes.sort(key=lambda x: x['intensity'], reverse=True)
 
-            profiles.append({
-                'turn_id': tid,
-                'a_frames': a_counts,
-                's_frames': s_counts,
-                'a_total': a_total,
-                's_total': s_total,
-                'basis': round(basis, 2),
-                'affekt_mult': round(affekt_mult, 3),
-                'agency_mult': agency_mult,
-                'agency_label': dominant_agency,
-                'k_mult': round(k_mult, 2),
-                'k_frames': list(k_frames_present),
-                'intensity': round(intensity, 2),
-                'intensity_norm': round(intensity_norm, 2),
-                'tension_axes': tension_axes,
-                'overlay_tags': list(overlay_tags.keys()),
-                'is_justice_site': True,
-                'text_preview': turn.text[:120],
-            })
+            profiles.append(JusticeTurnProfile(
+                turn_id=tid,
+                a_frames=a_counts,
+                s_frames=s_counts,
+                a_total=a_total,
+                s_total=s_total,
+                basis=_round(basis, 2),
+                affekt_mult=_round(affekt_mult, 3),
+                agency_mult=agency_mult,
+                agency_label=dominant_agency,
+                k_mult=_round(k_mult, 2),
+                k_frames=k_frames_present,
+                intensity=_round(intensity, 2),
+                intensity_norm=_round(intensity_norm, 2),
+                tension_axes=tension_axes,
+                overlay_tags=overlay_shared,
+                is_justice_site=True,
+                text_preview=text_preview,
+            ))
 
         self._turn_profiles = profiles
         return profiles
 
     def _empty_profile(self, tid, turn, a_counts, s_counts, overlay_tags):
         """Leeres Profil für Turns ohne Spannung."""
-        return {
-            'turn_id': tid,
-            'a_frames': a_counts,
-            's_frames': s_counts,
-            'a_total': sum(a_counts.values()),
-            's_total': sum(s_counts.values()),
-            'basis': 0,
-            'affekt_mult': 1.0,
-            'agency_mult': 1.0,
-            'agency_label': '-',
-            'k_mult': 1.0,
-            'k_frames': [],
-            'intensity': 0,
-            'intensity_norm': 0,
-            'tension_axes': [],
-            'overlay_tags': list(overlay_tags.keys()),
-            'is_justice_site': False,
-            'text_preview': turn.text[:120],
-        }
+        return JusticeTurnProfile(
+            turn_id=tid,
+            a_frames=a_counts,
+            s_frames=s_counts,
+            a_total=sum(a_counts.values()),
+            s_total=sum(s_counts.values()),
+            basis=0,
+            affekt_mult=1.0,
+            agency_mult=1.0,
+            agency_label='-',
+            k_mult=1.0,
+            k_frames=[],
+            intensity=0,
+            intensity_norm=0,
+            tension_axes=[],
+            overlay_tags=tuple(overlay_tags),
+            is_justice_site=False,
+            text_preview=self._turn_meta[tid][0],
+        )
 
     # ════════════════════════════════════════════════════
     # Interview-Level Aggregation
@@ -278,7 +411,7 @@ class JusticeAnalyzer:
             return self._interview_profil
 
         profiles = self.turn_profiles()
-        justice_sites = [p for p in profiles if p['is_justice_site']]
+        justice_sites = [p for p in profiles if p.is_justice_site]
         n_total = len(profiles)
 
         if not justice_sites:
@@ -295,61 +428,65 @@ class JusticeAnalyzer:
             }
             return self._interview_profil
 
-        # Gesamtscore
-        total_intensity = sum(p['intensity_norm'] for p in justice_sites)
+        # Intensitäten einmal extrahieren; Score, Peaks und P75 teilen
+        # sich die Liste statt justice_sites mehrfach zu durchlaufen
+        intensities = [p.intensity_norm for p in justice_sites]
+        total_intensity = sum(intensities)
 
         # Density
         density = len(justice_sites) / n_total if n_total else 0
 
-        # Peak turns (Top 3)
-        sorted_sites = sorted(justice_sites,
-                              key=lambda p: p['intensity_norm'], reverse=True)
-        peak_turns = [p['turn_id'] for p in sorted_sites[:3]]
+        # Peak turns (Top 3) — Heap statt Vollsortierung
+        peak_turns = [p.turn_id for p in heapq.nlargest(
+            3, justice_sites, key=lambda p: p.intensity_norm)]
 
         # P75 threshold für "strong"
-        intensities = sorted([p['intensity_norm'] for p in justice_sites])
         p75_idx = int(len(intensities) * 0.75)
-        p75_threshold = intensities[p75_idx] if intensities else 0
+        p75_threshold = sorted(intensities)[p75_idx] if intensities else 0
 
         # Tag strong sites
         for p in profiles:
-            p['is_justice_site_strong'] = (
-                p['is_justice_site'] and p['intensity_norm'] >= p75_threshold
+            p.is_justice_site_strong = (
+                p.is_justice_site and p.intensity_norm >= p75_threshold
             )
 
-        # Achsen aggregieren
-        axis_totals = defaultdict(lambda: {'count': 0, 'total_intensity': 0,
-                                           'turns': [], 'overlay_tags': set()})
+        # Achsen aggregieren — flache [count, total, turns, tags]-Listen
+        # statt defaultdict mit Dict-Factory: ein Lookup pro Achse,
+        # Index-Zugriff statt vier gehashter Key-Zugriffe.
+        axis_totals = {}
         for p in justice_sites:
-            for ax in p['tension_axes']:
+            tid = p.turn_id
+            for ax in p.tension_axes:
                 key = _axis_key(ax['a_frame'], ax['s_frame'])
-                axis_totals[key]['count'] += 1
-                axis_totals[key]['total_intensity'] += ax['intensity']
-                axis_totals[key]['turns'].append(p['turn_id'])
-                axis_totals[key]['overlay_tags'].update(ax['overlay_tags'])
+                entry = axis_totals.get(key)
+                if entry is None:
+                    entry = axis_totals[key] = [0, 0.0, [], set()]
+                entry[0] += 1
+                entry[1] += ax['intensity']
+                entry[2].append(tid)
+                entry[3].update(ax['overlay_tags'])
 
         # Dominant tension
         dominant = None
         if axis_totals:
-            dominant_key = max(axis_totals,
-                               key=lambda k: axis_totals[k]['total_intensity'])
+            dominant_key = max(axis_totals, key=lambda k: axis_totals[k][1])
+            dom = axis_totals[dominant_key]
             dominant = {
                 'axis': dominant_key,
-                'label': _axis_label(*dominant_key),
-                'count': axis_totals[dominant_key]['count'],
-                'total_intensity': round(
-                    axis_totals[dominant_key]['total_intensity'], 2),
+                'label': self._axis_labels[dominant_key],
+                'count': dom[0],
+                'total_intensity': round(dom[1], 2),
             }
 
         # Serialisierbare Achsen
         axes_out = {}
-        for key, data in axis_totals.items():
+        for key, (count, total, turns, tags) in axis_totals.items():
             axes_out[key] = {
-                'label': _axis_label(*key),
-                'count': data['count'],
-                'total_intensity': round(data['total_intensity'], 2),
-                'turns': data['turns'],
-                'overlay_tags': sorted(data['overlay_tags']),
+                'label': self._axis_labels[key],
+                'count': count,
+                'total_intensity': round(total, 2),
+                'turns': turns,
+                'overlay_tags': sorted(tags),
             }
 
         # Trajektorie
@@ -373,13 +510,13 @@ class JusticeAnalyzer:
         if len(justice_sites) < 3:
             return 'ZU_WENIG_DATEN'
 
-        # Sortiere nach turn_id
-        ordered = sorted(justice_sites, key=lambda p: p['turn_id'])
+        # turn_profiles liefert bereits Turn-Reihenfolge — kein Re-Sort
+        ordered = justice_sites
         n = len(ordered)
         third = max(n // 3, 1)
 
-        avg_first = sum(p['intensity_norm'] for p in ordered[:third]) / third
-        avg_last = sum(p['intensity_norm'] for p in ordered[-third:]) / third
+        avg_first = sum(p.intensity_norm for p in ordered[:third]) / third
+        avg_last = sum(p.intensity_norm for p in ordered[-third:]) / third
 
         if avg_last > avg_first * 1.3:
             return 'STEIGEND'
@@ -395,7 +532,10 @@ class JusticeAnalyzer:
     def generate_claims(self):
         """Erzeugt analytische Claims aus dem Spannungsprofil."""
         profil = self.interview_profil()
-        profiles = self.turn_profiles()
+        return self._generate_claims(profil, self._turn_profiles)
+
+    def _generate_claims(self, profil, profiles):
+        """Claims aus bereits berechneten Strukturen (ohne Memo-Checks)."""
         claims = []
 
         # 1. Dominanz-Claim
@@ -438,30 +578,30 @@ class JusticeAnalyzer:
                 'turns': [],
             })
 
-        # 3. Peak-Claims (Top 3 Stellen)
-        strong = [p for p in profiles if p.get('is_justice_site_strong')]
-        for p in sorted(strong, key=lambda x: x['intensity_norm'],
-                        reverse=True)[:3]:
-            top_axis = p['tension_axes'][0] if p['tension_axes'] else None
+        # 3. Peak-Claims (Top 3 Stellen) — Heap statt Vollsortierung
+        strong = [p for p in profiles if p.is_justice_site_strong]
+        for p in heapq.nlargest(3, strong,
+                                key=lambda x: x.intensity_norm):
+            top_axis = p.tension_axes[0] if p.tension_axes else None
             axis_info = f", Achse: {top_axis['label']}" if top_axis else ""
             tag_info = ""
-            if p['overlay_tags']:
-                tag_info = f", Kontext: {', '.join(p['overlay_tags'])}"
+            if p.overlay_tags:
+                tag_info = f", Kontext: {', '.join(p.overlay_tags)}"
 
             claims.append({
                 'typ': 'JUSTICE_PEAK',
                 'beschreibung': (
-                    f"Turn {p['turn_id']} ist eine intensive "
+                    f"Turn {p.turn_id} ist eine intensive "
                     f"(Un)Gerechtigkeitsstelle (Intensität "
-                    f"{p['intensity_norm']}/1000z, "
-                    f"{p['agency_label']}{axis_info}{tag_info})."
+                    f"{p.intensity_norm}/1000z, "
+                    f"{p.agency_label}{axis_info}{tag_info})."
                 ),
                 'prueffrage': (
-                    f"Was genau wird in Turn {p['turn_id']} als "
+                    f"Was genau wird in Turn {p.turn_id} als "
                     f"ungerecht erlebt? Welche konkrete Situation?"
                 ),
-                'staerke': p['intensity_norm'],
-                'turns': [p['turn_id']],
+                'staerke': p.intensity_norm,
+                'turns': [p.turn_id],
             })
 
         # 4. Density-Claim
@@ -508,82 +648,84 @@ class JusticeAnalyzer:
     # ════════════════════════════════════════════════════
 
     def print_profil(self):
-        """Gibt das vollständige Spannungsprofil auf der Konsole aus."""
+        """Gibt das vollständige Spannungsprofil auf der Konsole aus.
+
+        Sammelt alle Zeilen und schreibt sie in EINEM stdout-Write
+        (ein Syscall statt eines print() pro Zeile).
+        """
         profil = self.interview_profil()
-        profiles = self.turn_profiles()
+        profiles = self._turn_profiles
+
+        sep70 = "=" * 70
+        sep40 = "─" * 40
+        out = []
 
-        print("=" * 70)
-        print("   (UN)GERECHTIGKEITS-SPANNUNGSPROFIL")
-        print("   Epistemischer Status: Vorschläge zur Prüfung")
-        print("=" * 70)
+        out.append(sep70)
+        out.append("   (UN)GERECHTIGKEITS-SPANNUNGSPROFIL")
+        out.append("   Epistemischer Status: Vorschläge zur Prüfung")
+        out.append(sep70)
 
         # Klassifikationsquelle
-        print(f"\n  Klassifikation: {'Framebook' if self.a_frames != _DEFAULT_A else 'Default (hardcoded)'}")
-        print(f"  A-Frames (Anspruch): {sorted(self.a_frames)}")
-        print(f"  S-Frames (Struktur): {sorted(self.s_frames)}")
-        print(f"  K-Frames (Verstärkend): {sorted(self.k_frames_verst)}")
-        print(f"  K-Frames (Abschwächend): {sorted(self.k_frames_daempf)}")
+        out.append(f"\n  Klassifikation: {'Framebook' if self.a_frames != _DEFAULT_A else 'Default (hardcoded)'}")
+        out.append(f"  A-Frames (Anspruch): {sorted(self.a_frames)}")
+        out.append(f"  S-Frames (Struktur): {sorted(self.s_frames)}")
+        out.append(f"  K-Frames (Verstärkend): {sorted(self.k_frames_verst)}")
+        out.append(f"  K-Frames (Abschwächend): {sorted(self.k_frames_daempf)}")
 
         # Interview-Level
-        print(f"\n{'─'*40}")
-        print(f"  INTERVIEW-PROFIL")
-        print(f"{'─'*40}")
-        print(f"  Justice Score:          {profil['justice_score']}")
-        print(f"  Justice Density:        {profil['justice_density']*100:.0f}% "
-              f"({profil['n_justice_sites']}/{profil['n_turns_total']} Turns)")
-        print(f"  Trajektorie:            {profil['trajectory']}")
-        print(f"  Peak Turns:             {profil['peak_turns']}")
-        print(f"  Strong-Threshold (P75): {profil['justice_site_strong_threshold']}")
+        out.append(f"\n{sep40}")
+        out.append("  INTERVIEW-PROFIL")
+        out.append(sep40)
+        out.append(f"  Justice Score:          {profil['justice_score']}")
+        out.append(f"  Justice Density:        {profil['justice_density']*100:.0f}% "
+                   f"({profil['n_justice_sites']}/{profil['n_turns_total']} Turns)")
+        out.append(f"  Trajektorie:            {profil['trajectory']}")
+        out.append(f"  Peak Turns:             {profil['peak_turns']}")
+        out.append(f"  Strong-Threshold (P75): {profil['justice_site_strong_threshold']}")
 
         if profil['dominant_tension']:
             dt = profil['dominant_tension']
-            print(f"  Dominante Spannung:     {dt['label']}")
-            print(f"                          ({dt['count']} Turns, "
-                  f"Intensität {dt['total_intensity']})")
+            out.append(f"  Dominante Spannung:     {dt['label']}")
+            out.append(f"                          ({dt['count']} Turns, "
+                       f"Intensität {dt['total_intensity']})")
 
         # Achsen-Übersicht
-        print(f"\n{'─'*40}")
-        print(f"  SPANNUNGSACHSEN")
-        print(f"{'─'*40}")
+        out.append(f"\n{sep40}")
+        out.append("  SPANNUNGSACHSEN")
+        out.append(sep40)
         axes = profil['tension_axes']
         for key in sorted(axes, key=lambda k: axes[k]['total_intensity'],
                           reverse=True):
             ax = axes[key]
             tags = f"  [{', '.join(ax['overlay_tags'])}]" if ax['overlay_tags'] else ""
-            print(f"  {ax['label']:<40} "
-                  f"{ax['count']:>2}× | Σ {ax['total_intensity']:>6.2f}{tags}")
+            out.append(f"  {ax['label']:<40} "
+                       f"{ax['count']:>2}× | Σ {ax['total_intensity']:>6.2f}{tags}")
 
         # Turn-Details (nur justice_sites)
-        print(f"\n{'─'*40}")
-        print(f"  TURN-DETAILS (nur Gerechtigkeitsstellen)")
-        print(f"{'─'*40}")
+        out.append(f"\n{sep40}")
+        out.append("  TURN-DETAILS (nur Gerechtigkeitsstellen)")
+        out.append(sep40)
         for p in profiles:
-            if not p['is_justice_site']:
+            if not p.is_justice_site:
                 continue
-            strong = " ★" if p.get('is_justice_site_strong') else ""
-            tags = f" [{', '.join(p['overlay_tags'])}]" if p['overlay_tags'] else ""
-            print(f"\n  Turn {p['turn_id']}{strong}{tags}")
-            print(f"    A-Frames: {p['a_frames']}")
-            print(f"    S-Frames: {p['s_frames']}")
-            print(f"    Basis: {p['basis']} × Affekt {p['affekt_mult']} "
-                  f"× Agency {p['agency_mult']} ({p['agency_label']}) "
-                  f"× K {p['k_mult']}")
-            print(f"    → Intensität: {p['intensity']} "
-                  f"({p['intensity_norm']}/1000z)")
-            if p['tension_axes']:
-                top = p['tension_axes'][0]
-                print(f"    Top-Achse: {top['label']} ({top['intensity']})")
-            print(f"    «{p['text_preview']}»")
+            strong = " ★" if p.is_justice_site_strong else ""
+            tags = f" [{', '.join(p.overlay_tags)}]" if p.overlay_tags else ""
+            out.append(_TURN_TMPL.format(p=p, strong=strong, tags=tags))
+            if p.tension_axes:
+                top = p.tension_axes[0]
+                out.append(f"    Top-Achse: {top['label']} ({top['intensity']})")
+            out.append(f"    «{p.text_preview}»")
 
         # Claims
-        claims = self.generate_claims()
+        claims = self._generate_claims(profil, profiles)
         if claims:
-            print(f"\n{'─'*40}")
-            print(f"  CLAIMS")
-            print(f"{'─'*40}")
+            out.append(f"\n{sep40}")
+            out.append("  CLAIMS")
+            out.append(sep40)
             for c in claims:
-                print(f"\n  [{c['typ']}]")
-                print(f"    {c['beschreibung']}")
-                print(f"    → {c['prueffrage']}")
+                out.append(f"\n  [{c['typ']}]")
+                out.append(f"    {c['beschreibung']}")
+                out.append(f"    → {c['prueffrage']}")
 
-        print(f"\n{'='*70}")
+        out.append(f"\n{sep70}")
+        sys.stdout.write("\n".join(out) + "\n")
@@ -12,6 +12,7 @@ Prinzip:
 """
 
 import warnings
+from functools import lru_cache
 
 
 # Spacy-Modelle pro Sprache
@@ -47,6 +48,48 @@ MINIMAL_STOPWORDS = {
 }
 
 
+# Verfügbarkeit der optionalen Pakete einmal pro Prozess prüfen —
+# wiederholte try/except-Imports pro Gate-Konstruktion kosten sonst
+# Import-Maschinerie (sys.modules-Lookup + Exception-Handling).
+_SPACY_AVAILABLE = None
+_NLTK_AVAILABLE = None
+
+
+def _probe():
+    """Einmaliger Import-Probe-Lauf; setzt die Modul-Flags."""
+    global _SPACY_AVAILABLE, _NLTK_AVAILABLE
+    if _SPACY_AVAILABLE is None:
+        try:
+            import spacy  # noqa: F401
+            _SPACY_AVAILABLE = True
+        except ImportError:
+            _SPACY_AVAILABLE = False
+    if _NLTK_AVAILABLE is None:
+        try:
+            import nltk  # noqa: F401
+            _NLTK_AVAILABLE = True
+        except ImportError:
+            _NLTK_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _load_spacy(model_name):
+    """Lädt ein spaCy-Modell einmal pro Prozess (Modelle sind groß,
+    Deserialisierung dauert Sekunden — Gates teilen sich die Instanz).
+
+    NER wird ausgeschlossen: die Pipeline nutzt nur Tagger/Parser
+    (dep_, pos_, sents), und NER ist die teuerste Komponente."""
+    import spacy
+    return spacy.load(model_name, exclude=['ner'])
+
+
+@lru_cache(maxsize=None)
+def _nltk_stopwords(nltk_lang):
+    """NLTK-Stoppwörter als gecachtes frozenset pro Sprache."""
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words(nltk_lang))
+
+
 class LanguageGate:
     """
     Prüft und stellt sprachspezifische Ressourcen bereit.
@@ -70,22 +113,21 @@ class LanguageGate:
         self.has_spacy = False
         self.has_nltk_stopwords = False
         self.has_nltk_tokenizer = False
-        
+
+        _probe()
+
         # Spacy prüfen
-        try:
-            import spacy
+        if _SPACY_AVAILABLE:
             model_name = SPACY_MODELS.get(self.language)
             if model_name:
                 try:
-                    self._spacy_nlp = spacy.load(model_name)
+                    self._spacy_nlp = _load_spacy(model_name)
                     self.has_spacy = True
                 except OSError:
                     pass
-        except ImportError:
-            pass
-        
+
         # NLTK prüfen
-        try:
+        if _NLTK_AVAILABLE:
             from nltk.corpus import stopwords
             nltk_lang = NLTK_LANGUAGES.get(self.language)
             if nltk_lang:
@@ -94,15 +136,13 @@ class LanguageGate:
                     self.has_nltk_stopwords = True
                 except LookupError:
                     pass
-            
+
             from nltk.tokenize import sent_tokenize
             try:
                 sent_tokenize("Test.", language=nltk_lang or 'english')
                 self.has_nltk_tokenizer = True
             except LookupError:
                 pass
-        except ImportError:
-            pass
     
     @property
     def capability_level(self):
@@ -120,11 +160,9 @@ class LanguageGate:
         return self._spacy_nlp
     
     def get_stopwords(self):
-        """Gibt Stoppwörter zurück (NLTK oder Fallback)."""
+        """Gibt Stoppwörter zurück (NLTK gecacht oder Fallback)."""
         if self.has_nltk_stopwords:
-            from nltk.corpus import stopwords
-            nltk_lang = NLTK_LANGUAGES[self.language]
-            return set(stopwords.words(nltk_lang))
+            return _nltk_stopwords(NLTK_LANGUAGES[self.language])
         return MINIMAL_STOPWORDS.get(self.language, set())
     
     def get_patterns(self, framebook_entry):
@@ -149,7 +187,7 @@ class LanguageGate:
             )
         
         return patterns
-    
+
     def status_report(self):
         """Gibt einen Statusbericht über verfügbare Ressourcen."""
         report = {
@@ -8,10 +8,10 @@ Analysiert:
     - Top-N Wendepunkt-Kandidaten
 """
 
-import re
+import sys
 
 from core.base_module import AnalyseModul
-from core.datamodel import Annotation
+from core.datamodel import AnnKind, Annotation
 
 
 class ModulNarrativ(AnalyseModul):
@@ -27,7 +27,39 @@ class ModulNarrativ(AnalyseModul):
         )
         self.textsorten = textsorten_config
         self.prozessstrukturen = prozessstrukturen_config
-    
+        # Muster einmal pro Modul auflösen und kompilieren statt pro
+        # Satz/Turn — get_patterns und der re-Cache-Lookup lägen sonst
+        # im innersten Loop (Turns × Sätze × Muster).
+        self._ts_compiled = {
+            ts_name: [(p, self._compile(p))
+                      for p in self.gate.get_patterns(config)]
+            for ts_name, config in self.textsorten.items()
+        }
+        self._ps_patterns = {
+            name: self.gate.get_patterns(config)
+            for name, config in self.prozessstrukturen.items()
+        }
+        # Regel-Präfixe konstant pro Struktur (nicht pro Turn formatieren)
+        self._ps_regel = {
+            name: f"ps_{name.lower()}" for name in self.prozessstrukturen
+        }
+        # Kategorie-/Regel-Strings pro Textsorte einmal bauen und
+        # internen — vorher entstand pro Satz-Annotation ein neues
+        # f-String-Objekt; geteilte (interne) Keys machen die
+        # Counter-/Dict-Zugriffe in den Summaries zu Identitätsvergleichen.
+        self._ts_kategorie = {
+            ts: (sys.intern(f"TS_{ts}"), sys.intern(f"ts_{ts.lower()}"))
+            for ts in self.textsorten
+        }
+        # Satz → Klassifikation: analyse, zusammenfassung und
+        # wendepunkt_kandidaten klassifizieren dieselben Sätze — das
+        # Ergebnis ist bei fixen Mustern deterministisch pro Satz.
+        # Eine weitere Spezialisierung (per exec generierter
+        # Klassifikator mit hartkodierter Musterreihenfolge) würde nur
+        # den ersten Lauf pro Satz beschleunigen; alle Folgeläufe sind
+        # bereits ein Dict-Lookup.
+        self._ts_cache = {}
+
     def analyse(self, document):
         """
         Führt die narrative Analyse durch:
@@ -37,17 +69,21 @@ class ModulNarrativ(AnalyseModul):
         """
         n_annotations = 0
         turns = document.get_befragte_turns()
-        
+        # Cache pro Analyse-Lauf leeren (begrenzt Wachstum über Dokumente)
+        self._ts_cache.clear()
+
         for turn in turns:
             # 1. Textsorten pro Satz
             for satz in turn.saetze:
                 ts, indikatoren = self._klassifiziere_textsorte(satz)
                 if ts != 'UNBESTIMMT':
-                    for pattern, matched in indikatoren:
-                        ann = Annotation(
+                    kategorie, regel_id = self._ts_kategorie[ts]
+                    # Batch-Add (ein extend) statt add_annotation pro Treffer
+                    n_annotations += document.add_annotations(
+                        Annotation(
                             modul=self.modul_id,
-                            kategorie=f"TS_{ts}",
-                            regel_id=f"ts_{ts.lower()}",
+                            kategorie=kategorie,
+                            regel_id=regel_id,
                             pattern=pattern,
                             matched_text=matched,
                             matched_start=0,
@@ -55,20 +91,17 @@ class ModulNarrativ(AnalyseModul):
                             satz=satz,
                             turn_id=turn.turn_id,
                             confidence="pattern",
+                            kind=AnnKind.TS,
                         )
-                        document.add_annotation(ann)
-                        n_annotations += 1
+                        for pattern, matched in indikatoren
+                    )
             
             # 2. Prozessstrukturen pro Turn
-            for struktur_name, config in self.prozessstrukturen.items():
-                patterns = self.gate.get_patterns(config)
-                anns = self._pattern_search(
+            for struktur_name, patterns in self._ps_patterns.items():
+                n_annotations += document.add_annotations(self._pattern_search(
                     turn.text, struktur_name, patterns, turn.turn_id,
-                    regel_prefix=f"ps_{struktur_name.lower()}"
-                )
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
+                    regel_prefix=self._ps_regel[struktur_name]
+                ))
         
         return n_annotations
     
@@ -77,42 +110,58 @@ class ModulNarrativ(AnalyseModul):
         Klassifiziert einen Satz nach Textsorte.
         Returns: (textsorte_name, [(pattern, matched_text), ...])
         """
-        satz_lower = satz.lower()
+        cached = self._ts_cache.get(satz)
+        if cached is not None:
+            return cached
+
         best_ts = 'UNBESTIMMT'
         best_score = 0
         best_indikatoren = []
-        
-        for ts_name, config in self.textsorten.items():
-            patterns = self.gate.get_patterns(config)
+
+        # IGNORECASE-kompilierte Muster statt satz.lower() — erspart die
+        # lowercased Kopie pro Satz und erhält die Originalschreibung
+        # der Treffer (Audit Trail, analog _pattern_search).
+        # Ein finditer-Lauf pro Muster — eine Alternation pro Textsorte
+        # würde Treffer verlieren, die im Treffer eines anderen Musters
+        # liegen (vgl. _pattern_search in der Basisklasse).
+        for ts_name, compiled in self._ts_compiled.items():
             treffer = []
-            for pattern in patterns:
-                for match in re.finditer(pattern, satz_lower):
+            for pattern, pat in compiled:
+                for match in pat.finditer(satz):
                     treffer.append((pattern, match.group(0)))
             
             if len(treffer) > best_score:
                 best_score = len(treffer)
                 best_ts = ts_name
                 best_indikatoren = treffer
-        
-        return best_ts, best_indikatoren
+
+        result = (best_ts, best_indikatoren)
+        self._ts_cache[satz] = result
+        return result
     
     def zusammenfassung(self, document):
         """Turn-Level-Zusammenfassung: Textsorten-Sequenz und Prozessstrukturen."""
         turns = document.get_befragte_turns()
         rows = []
-        
+
+        # Annotations EINMAL holen und nach Turn gruppieren statt einer
+        # Index-Abfrage plus Modul-Nachfilter pro Turn
+        anns_by_turn = {}
+        for a in document.get_annotations(modul=self.modul_id):
+            anns_by_turn.setdefault(a.turn_id, []).append(a)
+
         for turn in turns:
-            # Textsorten-Sequenz
-            sequenz = []
-            for satz in turn.saetze:
-                ts, _ = self._klassifiziere_textsorte(satz)
-                sequenz.append(ts)
-            
+            # Textsorten-Sequenz (List Comprehension: str.join kann die
+            # Länge vorab bestimmen, anders als bei einem Generator)
+            sequenz = [self._klassifiziere_textsorte(satz)[0]
+                       for satz in turn.saetze]
+
+
             # Prozessstrukturen
-            ps_anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
+            ps_anns = anns_by_turn.get(turn.turn_id, [])
             ps_found = set()
             for a in ps_anns:
-                if not a.kategorie.startswith('TS_'):
+                if a.kind != AnnKind.TS:
                     ps_found.add(a.kategorie)
             
             # Übergänge zählen
@@ -125,7 +174,7 @@ class ModulNarrativ(AnalyseModul):
                 'turn_id': turn.turn_id,
                 'n_saetze': len(turn.saetze),
                 'sequenz': ' → '.join(sequenz),
-                'sequenz_kurz': ''.join(s[0] for s in sequenz),  # N→A→B wird "NAB"
+                'sequenz_kurz': ''.join([s[0] for s in sequenz]),  # N→A→B wird "NAB"
                 'n_transitions': transitions,
                 'prozessstrukturen': ', '.join(ps_found) if ps_found else '-',
                 'n_annotations': len(ps_anns),
@@ -144,17 +193,21 @@ class ModulNarrativ(AnalyseModul):
         """
         turns = document.get_befragte_turns()
         kandidaten = []
-        
+
+        # Ein Gruppier-Pass über die Modul-Annotations (wie zusammenfassung)
+        anns_by_turn = {}
+        for a in document.get_annotations(modul=self.modul_id):
+            anns_by_turn.setdefault(a.turn_id, []).append(a)
+
         for turn in turns:
             score = 0
             reasons = []
             
             # Textsorten-Wechsel
-            sequenz = []
-            for satz in turn.saetze:
-                ts, _ = self._klassifiziere_textsorte(satz)
-                sequenz.append(ts)
-            
+            sequenz = [self._klassifiziere_textsorte(satz)[0]
+                       for satz in turn.saetze]
+
+
             transitions = 0
             for i in range(1, len(sequenz)):
                 if sequenz[i] != sequenz[i-1] and 'UNBESTIMMT' not in (sequenz[i], sequenz[i-1]):
@@ -165,8 +218,8 @@ class ModulNarrativ(AnalyseModul):
                 reasons.append(f"{transitions} Textsorten-Wechsel")
             
             # Prozessstruktur-Marker
-            ps_anns = [a for a in document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
-                       if not a.kategorie.startswith('TS_')]
+            ps_anns = [a for a in anns_by_turn.get(turn.turn_id, [])
+                       if a.kind != AnnKind.TS]
             
             ps_types = set(a.kategorie for a in ps_anns)
             if len(ps_types) > 1:
@@ -181,13 +234,21 @@ class ModulNarrativ(AnalyseModul):
                 reasons.append("⚡ Verlaufskurve erkannt")
             
             if score > 0:
+                # Vorschau/Sequenz-String erst NACH dem Top-N-Schnitt
+                # bauen — für verworfene Kandidaten wären die
+                # String-Allokationen verschenkt.
                 kandidaten.append({
                     'turn_id': turn.turn_id,
                     'score': score,
                     'reasons': reasons,
-                    'sequenz': ' → '.join(sequenz),
-                    'text_vorschau': turn.text[:200] + '...' if len(turn.text) > 200 else turn.text,
+                    '_sequenz': sequenz,
+                    '_text': turn.text,
                 })
-        
+
         kandidaten.sort(key=lambda x: -x['score'])
-        return kandidaten[:n]
+        kandidaten = kandidaten[:n]
+        for k in kandidaten:
+            text = k.pop('_text')
+            k['sequenz'] = ' → '.join(k.pop('_sequenz'))
+            k['text_vorschau'] = text[:200] + '...' if len(text) > 200 else text
+        return kandidaten
@@ -7,15 +7,27 @@ Analysiert:
     - Positionierungswechsel über den Interviewverlauf
 """
 
-import re
+import sys
+from collections import Counter
 
 from core.base_module import AnalyseModul
-from core.datamodel import Annotation
+from core.datamodel import AnnKind, Annotation
 
 
 class ModulPosition(AnalyseModul):
     """Modul B: Subjektpositionierung."""
-    
+
+    # Subjekt-Varianten (mehrsprachig) und Modalverben als Klassen-
+    # Konstanten — vorher wurden die Sets pro Aufruf bzw. pro Token
+    # im Generator-Ausdruck neu gebaut.
+    _ICH_VARIANTEN = frozenset({'ich', 'i', 'je', 'yo'})
+    _WIR_VARIANTEN = frozenset({'wir', 'we', 'nous'})
+    _MAN_VARIANTEN = frozenset({'man', 'one', 'on'})
+    _MODALVERBEN = frozenset({
+        'muss', 'müssen', 'kann', 'können', 'soll', 'sollte',
+        'must', 'can', 'should',
+    })
+
     def __init__(self, language_gate, pronomen_config, agency_config):
         super().__init__(
             modul_id="B_position",
@@ -25,7 +37,38 @@ class ModulPosition(AnalyseModul):
         )
         self.pronomen_config = pronomen_config
         self.agency_config = agency_config
-    
+        # Muster einmal pro Modul auflösen/kompilieren statt pro Turn
+        self._agency_patterns = {
+            agency_type: self.gate.get_patterns(config)
+            for agency_type, config in self.agency_config.items()
+        }
+        # Regel-Präfixe konstant pro Agency-Typ (nicht pro Turn formatieren)
+        self._agency_regel = {
+            agency_type: f"agency_{agency_type.lower()}"
+            for agency_type in self.agency_config
+        }
+        # \bwort\b-Muster auf das reine Literal reduzieren: C-Level
+        # str.find mit manueller Wortgrenzen-Prüfung schlägt den
+        # Regex-Lauf für einzelne Nadeln. Alternationen (FREMDGRUPPE)
+        # bleiben beim kompilierten Muster.
+        self._pron_literals = {}
+        self._pron_compiled = {}
+        # Kategorie-/Regel-Strings pro Label einmal bauen und internen
+        # statt eines neuen f-Strings pro Annotation (geteilte Keys →
+        # Identitätsvergleich in den Summary-Countern)
+        self._pron_kategorie = {}
+        for label, pattern in \
+                self.pronomen_config.get(self.gate.language, {}).items():
+            self._pron_kategorie[label] = (
+                sys.intern(f"PRON_{label}"),
+                sys.intern(f"pron_{label.lower()}"),
+            )
+            if (pattern.startswith('\\b') and pattern.endswith('\\b')
+                    and pattern[2:-2].isalpha()):
+                self._pron_literals[label] = (pattern, pattern[2:-2].lower())
+            else:
+                self._pron_compiled[label] = (pattern, self._compile(pattern))
+
     def analyse(self, document):
         """
         Analysiert Pronomen und Agency pro Turn.
@@ -33,59 +76,86 @@ class ModulPosition(AnalyseModul):
         """
         n_annotations = 0
         turns = document.get_befragte_turns()
-        lang = self.gate.language
-        
-        # Pronomen-Muster für aktuelle Sprache
-        pron_patterns = self.pronomen_config.get(lang, {})
-        
+
+        # Spacy-Docs EINMAL im Batch parsen statt nlp(text) pro Turn —
+        # nlp.pipe parallelisiert Tokenisierung/Tagging intern und ist
+        # der teuerste Schritt der gesamten Pipeline.
+        nlp = self.gate.get_spacy()
+        docs_by_turn = {}
+        if nlp:
+            texte = [t.text for t in turns]
+            for turn, doc in zip(turns, nlp.pipe(texte, batch_size=32)):
+                docs_by_turn[turn.turn_id] = doc
+
         for turn in turns:
-            # 1. Pronomen-Analyse
-            for pron_label, pattern in pron_patterns.items():
-                anns = self._pronomen_search(
-                    turn.text, pron_label, pattern, turn.turn_id
+            # 1. Pronomen-Analyse (eine lowercased Kopie pro Turn,
+            # geteilt von allen Literal-Labels). str.lower() ist nicht
+            # längenerhaltend (z.B. 'İ' → 'i̇') — weicht die Länge ab,
+            # sind die Offsets der Kopie für den Originaltext
+            # unbrauchbar, dann laufen auch die Literal-Labels über
+            # die kompilierte IGNORECASE-Suche.
+            tlow = turn.text.lower()
+            if len(tlow) == len(turn.text):
+                for pron_label, (pattern, wort) in self._pron_literals.items():
+                    n_annotations += document.add_annotations(
+                        self._pronomen_literal_search(
+                            turn.text, tlow, pron_label, pattern, wort,
+                            turn.turn_id
+                        )
+                    )
+            else:
+                for pron_label, (pattern, wort) in self._pron_literals.items():
+                    n_annotations += document.add_annotations(
+                        self._pronomen_search(
+                            turn.text, pron_label, pattern,
+                            self._compile(pattern), turn.turn_id
+                        )
+                    )
+
+            for pron_label, (pattern, pat) in self._pron_compiled.items():
+                n_annotations += document.add_annotations(
+                    self._pronomen_search(
+                        turn.text, pron_label, pattern, pat, turn.turn_id
+                    )
                 )
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
-            
+
             # 2. Agency-Analyse
-            for agency_type, config in self.agency_config.items():
-                patterns = self.gate.get_patterns(config)
-                anns = self._pattern_search(
+            for agency_type, patterns in self._agency_patterns.items():
+                n_annotations += document.add_annotations(self._pattern_search(
                     turn.text, agency_type, patterns, turn.turn_id,
-                    regel_prefix=f"agency_{agency_type.lower()}"
-                )
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
+                    regel_prefix=self._agency_regel[agency_type],
+                    kind=AnnKind.AGENCY,
+                ))
             
             # 3. Spacy-basierte syntaktische Analyse (wenn verfügbar)
-            nlp = self.gate.get_spacy()
-            if nlp:
-                spacy_anns = self._syntactic_agency(nlp, turn)
-                for ann in spacy_anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
+            doc = docs_by_turn.get(turn.turn_id)
+            if doc is not None:
+                n_annotations += document.add_annotations(
+                    self._syntactic_agency(doc, turn)
+                )
         
         return n_annotations
     
-    def _pronomen_search(self, text, label, pattern, turn_id):
+    def _pronomen_search(self, text, label, pattern, pat, turn_id):
         """
         Sucht Pronomen, unterscheidet aber:
         - 'strong': Pronomen ist syntaktisches Subjekt
         - 'weak': Pronomen in anderer Position
-        
+
         Ohne Spacy: alles als 'pattern' Confidence.
         Mit Spacy: syntaktische Prüfung.
+
+        `pat` ist das vorkompilierte (IGNORECASE-)Muster; der Text wird
+        nicht mehr lowercased — Treffer behalten die Originalschreibung.
         """
         annotations = []
-        text_lower = text.lower()
-        
-        for match in re.finditer(pattern, text_lower):
+        kategorie, regel_id = self._pron_kategorie[label]
+
+        for match in pat.finditer(text):
             ann = Annotation(
                 modul=self.modul_id,
-                kategorie=f"PRON_{label}",
-                regel_id=f"pron_{label.lower()}",
+                kategorie=kategorie,
+                regel_id=regel_id,
                 pattern=pattern,
                 matched_text=match.group(0),
                 matched_start=match.start(),
@@ -93,27 +163,75 @@ class ModulPosition(AnalyseModul):
                 satz=self._find_containing_sentence(text, match.start()),
                 turn_id=turn_id,
                 confidence="pattern",
+                kind=AnnKind.PRON,
             )
             annotations.append(ann)
         
         return annotations
     
-    def _syntactic_agency(self, nlp, turn):
+    def _pronomen_literal_search(self, text, tlow, label, pattern, wort, turn_id):
+        """
+        Literal-Fastpath für \\bwort\\b-Pronomen: str.find über die
+        lowercased Turn-Kopie plus manuelle Wortgrenzen-Prüfung —
+        semantisch äquivalent zur IGNORECASE-Regex-Suche, aber ohne
+        Engine-Lauf pro Nadel. matched_text behält die
+        Originalschreibung (Audit Trail).
+        """
+        annotations = []
+        kategorie, regel_id = self._pron_kategorie[label]
+        n = len(wort)
+        ende = len(tlow)
+        start = tlow.find(wort)
+        while start != -1:
+            stop = start + n
+            # \b: Nachbar ist kein Wortzeichen ([\w] = alnum oder _)
+            links_frei = start == 0 or not (
+                tlow[start - 1].isalnum() or tlow[start - 1] == '_')
+            rechts_frei = stop == ende or not (
+                tlow[stop].isalnum() or tlow[stop] == '_')
+            if links_frei and rechts_frei:
+                annotations.append(Annotation(
+                    modul=self.modul_id,
+                    kategorie=kategorie,
+                    regel_id=regel_id,
+                    pattern=pattern,
+                    matched_text=text[start:stop],
+                    matched_start=start,
+                    matched_end=stop,
+                    satz=self._find_containing_sentence(text, start),
+                    turn_id=turn_id,
+                    confidence="pattern",
+                    kind=AnnKind.PRON,
+                ))
+            start = tlow.find(wort, stop)
+        return annotations
+
+    def _syntactic_agency(self, doc, turn):
         """
         Spacy-basierte Analyse: Wer ist grammatisches Subjekt?
-        
+
+        `doc` ist der in analyse() batch-geparste Spacy-Doc des Turns.
+
         Unterscheidet:
         - ICH als Subjekt von aktivem Verb → AGENCY_SYNTACTIC_AKTIV
         - ICH als Subjekt von passivem/modalen Verb → AGENCY_SYNTACTIC_PASSIV
         - Andere Subjekte → Fremdpositionierung
         """
-        doc = nlp(turn.text)
         annotations = []
-        
-        ich_varianten = {'ich', 'i', 'je', 'yo'}  # Mehrsprachig
-        wir_varianten = {'wir', 'we', 'nous'}
-        man_varianten = {'man', 'one', 'on'}
-        
+
+        # Head-Index → (auxpass?, Modal-aux?) in EINEM Pass über alle
+        # Tokens: Subjekte, die sich einen Head teilen, lösen sonst
+        # denselben children-Scan mehrfach aus.
+        head_aux = {}
+        for t in doc:
+            dep = t.dep_
+            if dep == 'auxpass':
+                hi = t.head.i
+                head_aux[hi] = (True, head_aux.get(hi, (False, False))[1])
+            elif dep == 'aux' and t.text.lower() in self._MODALVERBEN:
+                hi = t.head.i
+                head_aux[hi] = (head_aux.get(hi, (False, False))[0], True)
+
         for token in doc:
             # Nur Subjekte betrachten
             if token.dep_ not in ('sb', 'nsubj', 'nsubj:pass'):
@@ -122,42 +240,32 @@ class ModulPosition(AnalyseModul):
             token_lower = token.text.lower()
             
             # Bestimme Kategorie
-            if token_lower in ich_varianten:
+            if token_lower in self._ICH_VARIANTEN:
                 subj_type = "ICH"
-            elif token_lower in wir_varianten:
+            elif token_lower in self._WIR_VARIANTEN:
                 subj_type = "WIR"
-            elif token_lower in man_varianten:
+            elif token_lower in self._MAN_VARIANTEN:
                 subj_type = "MAN"
             else:
                 subj_type = "ANDERE"
             
-            # Prüfe ob aktiv oder passiv
+            # Prüfe ob aktiv oder passiv — Lookup im vorab gebauten
+            # Head-Index statt children-Scan pro Subjekt
             head = token.head
-            is_passive = token.dep_ == 'nsubj:pass' or any(
-                child.dep_ == 'auxpass' for child in head.children
-            )
-            is_modal = head.pos_ == 'AUX' or any(
-                child.dep_ == 'aux' and child.text.lower() in 
-                {'muss', 'müssen', 'kann', 'können', 'soll', 'sollte', 'must', 'can', 'should'}
-                for child in head.children
-            )
-            
-            if is_passive:
-                voice = "PASSIV"
-            elif is_modal:
-                voice = "MODAL"
-            else:
-                voice = "AKTIV"
-            
+            has_auxpass, has_modal_aux = head_aux.get(head.i, (False, False))
+
+            is_passive = token.dep_ == 'nsubj:pass' or has_auxpass
+            is_modal = head.pos_ == 'AUX' or has_modal_aux
+            voice = ('PASSIV' if is_passive
+                     else 'MODAL' if is_modal else 'AKTIV')
+
+
             kategorie = f"SYNTACTIC_{subj_type}_{voice}"
             
-            # Satz finden
-            satz = ""
-            for sent in doc.sents:
-                if sent.start <= token.i < sent.end:
-                    satz = sent.text
-                    break
-            
+            # token.sent ist O(1) statt linearem Scan über doc.sents
+            satz = token.sent.text
+
+
             ann = Annotation(
                 modul=self.modul_id,
                 kategorie=kategorie,
@@ -169,6 +277,7 @@ class ModulPosition(AnalyseModul):
                 satz=satz,
                 turn_id=turn.turn_id,
                 confidence="syntactic",
+                kind=AnnKind.SYNTACTIC,
             )
             annotations.append(ann)
         
@@ -178,40 +287,41 @@ class ModulPosition(AnalyseModul):
         """Turn-Level-Zusammenfassung der Positionierung."""
         turns = document.get_befragte_turns()
         rows = []
-        
+
+        # Annotations EINMAL holen und nach Turn gruppieren statt einer
+        # Index-Abfrage plus Modul-Nachfilter pro Turn
+        anns_by_turn = {}
+        for a in document.get_annotations(modul=self.modul_id):
+            anns_by_turn.setdefault(a.turn_id, []).append(a)
+
         for turn in turns:
-            anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
-            
-            # Pronomen-Zählung
-            pron_counts = {}
-            for a in anns:
-                if a.kategorie.startswith('PRON_'):
-                    label = a.kategorie.replace('PRON_', '')
-                    pron_counts[label] = pron_counts.get(label, 0) + 1
-            
-            # Agency-Zählung (Regex-basiert)
-            agency_counts = {}
-            for a in anns:
-                if a.kategorie in ('AKTIV_HANDELND', 'ERLEIDEND_PASSIV', 'MORALISCH_REFLEKTIEREND'):
-                    agency_counts[a.kategorie] = agency_counts.get(a.kategorie, 0) + 1
-            
-            # Syntaktische Agency (Spacy-basiert)
-            syntactic = {}
+            anns = anns_by_turn.get(turn.turn_id, [])
+
+            # Ein Durchlauf über die Annotations statt drei; Dispatch
+            # über den Kind-Diskriminator, Zählung via Counter.
+            pron_counts = Counter()
+            agency_counts = Counter()
+            syntactic = Counter()
             for a in anns:
-                if a.kategorie.startswith('SYNTACTIC_'):
-                    syntactic[a.kategorie] = syntactic.get(a.kategorie, 0) + 1
-            
+                kind = a.kind
+                if kind == AnnKind.PRON:
+                    pron_counts[a.kategorie[5:]] += 1  # 'PRON_'-Präfix ab
+                elif kind == AnnKind.AGENCY:
+                    agency_counts[a.kategorie] += 1
+                elif kind == AnnKind.SYNTACTIC:
+                    syntactic[a.kategorie] += 1
+
             # Dominante Agency
             dominant_agency = '-'
             if agency_counts:
-                dominant_agency = max(agency_counts, key=agency_counts.get)
+                dominant_agency = agency_counts.most_common(1)[0][0]
             
             rows.append({
                 'turn_id': turn.turn_id,
                 'n_woerter': turn.n_woerter,
-                'pronomen': pron_counts,
-                'agency_regex': agency_counts,
-                'agency_syntactic': syntactic,
+                'pronomen': dict(pron_counts),
+                'agency_regex': dict(agency_counts),
+                'agency_syntactic': dict(syntactic),
                 'dominant_agency': dominant_agency,
                 'agency_dichte': self._compute_density(
                     sum(agency_counts.values()), turn.n_woerter
@@ -7,9 +7,13 @@ UPGRADE v4: Erzeugt nicht nur Annotations, sondern CLAIMS:
     - Frame-Trajektorien (Dominanzverschiebung über Interview)
 """
 
-import re
+import sys
+import weakref
+from collections import Counter, defaultdict
+from itertools import combinations
 
 from core.base_module import AnalyseModul
+from core.datamodel import AnnKind
 
 
 class ModulDiskurs(AnalyseModul):
@@ -28,42 +32,82 @@ class ModulDiskurs(AnalyseModul):
         self.frame_spannungen = frame_spannungen or []
         self.frame_priorities = frame_priorities or {}
         self.frame_conflicts = frame_conflicts or []
-    
+        # Muster einmal pro Modul auflösen statt pro Turn
+        self._frame_patterns = {
+            frame_name: self.gate.get_patterns(config)
+            for frame_name, config in self.frames.items()
+        }
+        self._topos_patterns = {
+            topos_name: self.gate.get_patterns(config)
+            for topos_name, config in self.topoi.items()
+        }
+        # Regel-Präfixe und TOPOS_-Kategorien konstant pro Eintrag
+        # (nicht pro Turn formatieren); Kategorie intern für geteilte
+        # Dict-Keys in den Summary-Countern
+        self._frame_regel = {
+            name: f"frame_{name.lower()}" for name in self.frames
+        }
+        self._topos_regel = {
+            name: (sys.intern(f"TOPOS_{name}"), f"topos_{name.lower()}")
+            for name in self.topoi
+        }
+        # Spannungs-Definitionen einmal auf (frame_a, frame_b,
+        # beschreibung) normalisieren statt vier sp.get()-Lookups pro
+        # Spannung bei jedem Claims-Lauf.
+        self._spannung_tuples = []
+        for sp in self.frame_spannungen:
+            fa = sp.get('frame_a', sp.get('frame_1', ''))
+            fb = sp.get('frame_b', sp.get('frame_2', ''))
+            self._spannung_tuples.append(
+                (fa, fb, sp.get('beschreibung', f'{fa} vs. {fb}'))
+            )
+        # Letzte Zusammenfassung: (Weakref aufs Dokument, #Annotations,
+        # rows) — generate_claims und externe Aufrufer teilen sich das
+        # Ergebnis. Weakref statt id(): die Objekt-id eines bereits
+        # eingesammelten Dokuments kann recycelt werden und lieferte
+        # dann veraltete Zeilen für ein fremdes Dokument.
+        self._summary_cache = None
+
     def analyse(self, document):
         """Frames und Topoi erkennen, Annotations schreiben."""
         n_annotations = 0
         turns = document.get_befragte_turns()
         
         for turn in turns:
-            for frame_name, config in self.frames.items():
-                patterns = self.gate.get_patterns(config)
-                anns = self._pattern_search(
+            for frame_name, patterns in self._frame_patterns.items():
+                n_annotations += document.add_annotations(self._pattern_search(
                     turn.text, frame_name, patterns, turn.turn_id,
-                    regel_prefix=f"frame_{frame_name.lower()}")
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
-            
-            for topos_name, config in self.topoi.items():
-                patterns = self.gate.get_patterns(config)
-                anns = self._pattern_search(
-                    turn.text, f"TOPOS_{topos_name}", patterns, turn.turn_id,
-                    regel_prefix=f"topos_{topos_name.lower()}")
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
+                    regel_prefix=self._frame_regel[frame_name]))
+
+            for topos_name, patterns in self._topos_patterns.items():
+                kategorie, regel_prefix = self._topos_regel[topos_name]
+                n_annotations += document.add_annotations(self._pattern_search(
+                    turn.text, kategorie, patterns, turn.turn_id,
+                    regel_prefix=regel_prefix,
+                    kind=AnnKind.TOPOS))
         
         return n_annotations
     
     def zusammenfassung(self, document):
-        """Turn-Level-Zusammenfassung mit Priority/Conflict-Gewichtung."""
+        """Turn-Level-Zusammenfassung mit Priority/Conflict-Gewichtung (memoisiert)."""
+        cached = self._summary_cache
+        if (cached is not None and cached[0]() is document
+                and cached[1] == len(document.annotations)):
+            return cached[2]
+
+        # Annotations EINMAL holen und nach Turn gruppieren statt einer
+        # Index-Abfrage plus Modul-Nachfilter pro Turn
+        anns_by_turn = {}
+        for a in document.get_annotations(modul=self.modul_id):
+            anns_by_turn.setdefault(a.turn_id, []).append(a)
+
         rows = []
         for turn in document.get_befragte_turns():
-            anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
+            anns = anns_by_turn.get(turn.turn_id, [])
             frame_counts = {}
             topos_counts = {}
             for a in anns:
-                if a.kategorie.startswith('TOPOS_'):
+                if a.kind == AnnKind.TOPOS:
                     topos_counts[a.kategorie] = topos_counts.get(a.kategorie, 0) + 1
                 else:
                     frame_counts[a.kategorie] = frame_counts.get(a.kategorie, 0) + 1
@@ -89,6 +133,10 @@ class ModulDiskurs(AnalyseModul):
                 'n_frames_aktiv': len(frame_counts),
                 'frame_dichte': self._compute_density(sum(frame_counts.values()), turn.n_woerter),
             })
+        # Nur den letzten Stand halten (kein Wachstum über Dokumente)
+        self._summary_cache = (
+            weakref.ref(document), len(document.annotations), rows
+        )
         return rows
 
     def _apply_conflicts(self, frame_counts):
@@ -131,42 +179,56 @@ class ModulDiskurs(AnalyseModul):
             Liste von Claim-Dicts mit: typ, beschreibung, evidenz, turns, prüffrage
         """
         claims = []
-        
+
+        # Gemeinsame Strukturen EINMAL berechnen und durchreichen —
+        # vorher hat jeder Claim-Helfer die Annotations selbst erneut
+        # durchlaufen.
+        summary = self.zusammenfassung(document)
+        frames_by_turn = self._frames_by_turn(document)
+        turns = document.get_befragte_turns()
+
         # 1. Ko-Okkurrenz-Claims
-        claims.extend(self._claims_ko_okkurrenz(document))
-        
+        claims.extend(self._claims_ko_okkurrenz(turns, frames_by_turn))
+
         # 2. Trajektorien-Claims
-        claims.extend(self._claims_trajektorie(document))
-        
+        claims.extend(self._claims_trajektorie(summary))
+
         # 3. Spannungs-Claims
-        claims.extend(self._claims_spannungen(document))
-        
+        claims.extend(self._claims_spannungen(turns, frames_by_turn))
+
         # 4. Dominanz-Claims
         claims.extend(self._claims_dominanz(document))
-        
+
         return claims
     
-    def _claims_ko_okkurrenz(self, document):
+    def _frames_by_turn(self, document):
+        """
+        Frame-Kategorien pro Turn als Set (ohne Topoi), in einem Pass
+        über die Modul-Annotations — die Claim-Helfer teilen sich das
+        Ergebnis, statt pro Turn (oder pro Spannung × Turn) neu
+        abzufragen.
+        """
+        frames_by_turn = {}
+        for a in document.get_annotations(modul=self.modul_id):
+            if a.kind != AnnKind.TOPOS:
+                frames_by_turn.setdefault(a.turn_id, set()).add(a.kategorie)
+        return frames_by_turn
+
+    def _claims_ko_okkurrenz(self, turns, frames_by_turn):
         """Welche Frames treten wiederholt gemeinsam auf?"""
         claims = []
-        turns = document.get_befragte_turns()
-        
-        # Zähle Frame-Paare über alle Turns
-        paar_counts = {}
-        paar_turns = {}
         
+        # Zähle Frame-Paare über alle Turns: combinations liefert die
+        # sortierten Paare direkt, Counter/defaultdict ersetzen die
+        # Hand-Buchführung der verschachtelten Index-Schleifen.
+        paar_counts = Counter()
+        paar_turns = defaultdict(list)
+
         for turn in turns:
-            anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
-            frames_in_turn = set(a.kategorie for a in anns if not a.kategorie.startswith('TOPOS_'))
-            
-            frame_list = sorted(frames_in_turn)
-            for i in range(len(frame_list)):
-                for j in range(i + 1, len(frame_list)):
-                    paar = (frame_list[i], frame_list[j])
-                    paar_counts[paar] = paar_counts.get(paar, 0) + 1
-                    if paar not in paar_turns:
-                        paar_turns[paar] = []
-                    paar_turns[paar].append(turn.turn_id)
+            paare = list(combinations(sorted(frames_by_turn.get(turn.turn_id, ())), 2))
+            paar_counts.update(paare)
+            for paar in paare:
+                paar_turns[paar].append(turn.turn_id)
         
         for paar, count in paar_counts.items():
             if count >= 2:
@@ -183,11 +245,10 @@ class ModulDiskurs(AnalyseModul):
         
         return claims
     
-    def _claims_trajektorie(self, document):
+    def _claims_trajektorie(self, summary):
         """Verschiebt sich die Frame-Dominanz über das Interview?"""
         claims = []
-        summary = self.zusammenfassung(document)
-        
+
         if len(summary) < 3:
             return claims
         
@@ -197,11 +258,12 @@ class ModulDiskurs(AnalyseModul):
         drittel_3 = summary[-(n // 3):] if n >= 3 else summary[-1:]
         
         def dominant_frames(rows):
-            counts = {}
+            # Counter.update merged die Frame-Dicts in C statt per
+            # Python-Schleife mit dict.get pro Key
+            counts = Counter()
             for r in rows:
-                for f, c in r['frames'].items():
-                    counts[f] = counts.get(f, 0) + c
-            return counts
+                counts.update(r['frames'])
+            return dict(counts)
         
         frames_anfang = dominant_frames(drittel_1)
         frames_ende = dominant_frames(drittel_3)
@@ -253,20 +315,19 @@ class ModulDiskurs(AnalyseModul):
         
         return claims
     
-    def _claims_spannungen(self, document):
-        """Prüft auf theoretisch definierte Frame-Spannungen."""
+    def _claims_spannungen(self, turns, frames_by_turn):
+        """Prüft auf theoretisch definierte Frame-Spannungen.
+
+        `frames_by_turn` enthält keine Topoi — unkritisch, da
+        frame_a/frame_b immer Frame-Namen sind und TOPOS_-Kategorien
+        nie matchen könnten.
+        """
         claims = []
-        turns = document.get_befragte_turns()
-        
-        for sp in self.frame_spannungen:
-            fa = sp.get('frame_a', sp.get('frame_1', ''))
-            fb = sp.get('frame_b', sp.get('frame_2', ''))
-            beschr = sp.get('beschreibung', f'{fa} vs. {fb}')
-            
+
+        for fa, fb, beschr in self._spannung_tuples:
             ko_turns = []
             for turn in turns:
-                anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
-                frames_here = set(a.kategorie for a in anns)
+                frames_here = frames_by_turn.get(turn.turn_id, ())
                 if fa in frames_here and fb in frames_here:
                     ko_turns.append(turn.turn_id)
             
@@ -289,10 +350,9 @@ class ModulDiskurs(AnalyseModul):
         claims = []
         all_anns = document.get_annotations(modul=self.modul_id)
 
-        frame_total = {}
-        for a in all_anns:
-            if not a.kategorie.startswith('TOPOS_'):
-                frame_total[a.kategorie] = frame_total.get(a.kategorie, 0) + 1
+        frame_total = Counter(
+            a.kategorie for a in all_anns if a.kind != AnnKind.TOPOS
+        )
 
         if not frame_total:
             return claims
@@ -311,7 +371,7 @@ class ModulDiskurs(AnalyseModul):
 
         if pct > 40:
             # Prüfe ob Dominanz durch Downweighting verändert wurde
-            raw_dominant = max(frame_total, key=frame_total.get)
+            raw_dominant = frame_total.most_common(1)[0][0]
             raw_pct = frame_total[raw_dominant] / sum(frame_total.values()) * 100
 
             note = ""
@@ -325,8 +385,8 @@ class ModulDiskurs(AnalyseModul):
                     f"Frame {dominant} dominiert das Interview "
                     f"({pct:.0f}% der gewichteten Frame-Marker){note}"
                 ),
-                'evidenz': f"Raw: {frame_total} | Adjusted: "
-                           f"{{{k}: {v:.1f} for k, v in adjusted.items()}}",
+                'evidenz': f"Raw: {dict(frame_total)} | Adjusted: "
+                           f"{ {k: round(v, 1) for k, v in adjusted.items()} }",
                 'turns': [],
                 'frames': [dominant],
                 'staerke': round(pct),
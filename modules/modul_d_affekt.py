@@ -10,7 +10,9 @@ Analysiert nicht "positiv/negativ", sondern:
 Output: Stellen affektiver Aufladung + Begründung (kein "Score")
 """
 
-import re
+import heapq
+import weakref
+from collections import Counter
 
 from core.base_module import AnalyseModul
 
@@ -26,58 +28,120 @@ class ModulAffekt(AnalyseModul):
             framebook_section=affekt_config,
         )
         self.affekt_dimensionen = affekt_config
-    
+        # Muster einmal pro Modul auflösen statt pro Turn × Dimension
+        # (get_patterns selbst bleibt unmemoisiert: zwei Dict-Lookups,
+        # und alle Module heben das Ergebnis ohnehin hierher).
+        # Die Suche selbst läuft über _pattern_search: ein
+        # finditer-Lauf pro Muster, davor der optionale
+        # Aho-Corasick-Vorfilter für rein literale Listen. Ein voller
+        # Aho-Corasick-Treffer-Pfad wäre hier nicht äquivalent: einige
+        # Indikatoren sind echte Regexe (.{0,30}-Lücken), und der
+        # Automat meldet überlappende Vorkommen, wo finditer pro Muster
+        # nicht-überlappend matcht — die Markerzahlen gingen auseinander.
+        # Tupel statt Listen: der Cache-Key in _literal_automaton
+        # ist dann das Objekt selbst, kein tuple()-Neubau pro Aufruf.
+        self._dim_patterns = {
+            dim_name: tuple(self.gate.get_patterns(config))
+            for dim_name, config in self.affekt_dimensionen.items()
+        }
+        # Muster und Vorfilter pro Dimension schon beim Init
+        # kompilieren, nicht erst beim ersten Turn des ersten Dokuments
+        for patterns in self._dim_patterns.values():
+            for p in patterns:
+                self._compile(p)
+            self._literal_automaton(patterns)
+        # Regel-Präfixe sind konstant pro Dimension — nicht pro
+        # Turn × Dimension neu formatieren
+        self._dim_regel = {
+            dim_name: f"affekt_{dim_name.lower()}"
+            for dim_name in self._dim_patterns
+        }
+        # Letzte Zusammenfassung: (Weakref aufs Dokument, #Annotations,
+        # rows) — zusammenfassung und verdichtungsstellen teilen sich
+        # das Ergebnis (analog ModulDiskurs). Weakref statt id(): die
+        # Objekt-id eines eingesammelten Dokuments kann recycelt werden
+        # und lieferte dann Zeilen für ein fremdes Dokument.
+        self._summary_cache = None
+        # Laufende Marker-Zählung aus analyse(): (Weakref aufs Dokument,
+        # #eigene Annotations, {turn_id: {dimension: count}}).
+        # Erspart zusammenfassung den erneuten Gruppier-Pass; liegt am
+        # Modul, nicht am Dokument — Rohdaten bleiben analysefrei.
+        self._turn_counts = None
+
     def analyse(self, document):
         """Affektmarker erkennen und als Annotations schreiben."""
         n_annotations = 0
         turns = document.get_befragte_turns()
-        
+
+        turn_counts = {}
         for turn in turns:
-            for dim_name, config in self.affekt_dimensionen.items():
-                patterns = self.gate.get_patterns(config)
-                anns = self._pattern_search(
+            tc = {}
+            for dim_name, patterns in self._dim_patterns.items():
+                n = document.add_annotations(self._pattern_search(
                     turn.text, dim_name, patterns, turn.turn_id,
-                    regel_prefix=f"affekt_{dim_name.lower()}"
-                )
-                for ann in anns:
-                    document.add_annotation(ann)
-                    n_annotations += 1
-        
+                    regel_prefix=self._dim_regel[dim_name]
+                ))
+                if n:
+                    tc[dim_name] = n
+                    n_annotations += n
+            turn_counts[turn.turn_id] = tc
+
+        self._turn_counts = (
+            weakref.ref(document), n_annotations, turn_counts
+        )
         return n_annotations
     
     def zusammenfassung(self, document):
         """
-        Turn-Level-Zusammenfassung.
-        
+        Turn-Level-Zusammenfassung (memoisiert).
+
         Gibt Marker-Dichte und Marker-Typen zurück (nicht einen Score!).
         """
+        cached = self._summary_cache
+        if (cached is not None and cached[0]() is document
+                and cached[1] == len(document.annotations)):
+            return cached[2]
+
         turns = document.get_befragte_turns()
         rows = []
-        
+
+        # Die in analyse() mitgeführte Zählung wiederverwenden, solange
+        # sie noch zum Annotationsbestand des Moduls passt; sonst
+        # (z.B. nach einem Merge) einmal neu gruppieren.
+        eigene = document.get_annotations(modul=self.modul_id)
+        entry = self._turn_counts
+        if (entry is not None and entry[0]() is document
+                and entry[1] == len(eigene)):
+            counts_by_turn = entry[2]
+        else:
+            counts_by_turn = {}
+            for a in eigene:
+                tc = counts_by_turn.setdefault(a.turn_id, Counter())
+                tc[a.kategorie] += 1
+
         for turn in turns:
-            anns = document.get_annotations(modul=self.modul_id, turn_id=turn.turn_id)
-            
-            # Zählung pro Dimension
-            dim_counts = {}
-            for a in anns:
-                dim_counts[a.kategorie] = dim_counts.get(a.kategorie, 0) + 1
-            
-            n_marker = len(anns)
+            dim_counts = counts_by_turn.get(turn.turn_id, {})
+
+            n_marker = sum(dim_counts.values())
             dichte = self._compute_density(n_marker, turn.n_woerter)
-            
-            # Marker-Typen (welche Dimensionen sind aktiv?)
-            aktive_dimensionen = [d for d, c in dim_counts.items() if c > 0]
-            
+
+            # Marker-Typen: jede gezählte Dimension ist aktiv (c > 0 immer)
+            aktive_dimensionen = list(dim_counts)
+
             rows.append({
                 'turn_id': turn.turn_id,
                 'n_woerter': turn.n_woerter,
                 'n_marker': n_marker,
                 'marker_dichte': dichte,
-                'dimensionen': dim_counts,
+                'dimensionen': dict(dim_counts),
                 'aktive_dimensionen': aktive_dimensionen,
                 'n_dimensionen_aktiv': len(aktive_dimensionen),
             })
-        
+
+        # Nur den letzten Stand halten (kein Wachstum über Dokumente)
+        self._summary_cache = (
+            weakref.ref(document), len(document.annotations), rows
+        )
         return rows
     
     def verdichtungsstellen(self, document, n=5):
@@ -93,59 +157,77 @@ class ModulAffekt(AnalyseModul):
             Liste der aufschlussreichsten Stellen mit Begründung.
         """
         summary = self.zusammenfassung(document)
-        turns = {t.turn_id: t for t in document.get_befragte_turns()}
-        
-        kandidaten = []
+
+        # Die dims-Membership-Checks bleiben String-Keys: es gibt fünf
+        # Dimensionen mit gecachtem String-Hash — Integer-Codes oder
+        # ein Array-Layout würden hier nur Indirektion einkaufen.
+        # Score als ein Ausdruck pro Turn; Begründungen und Vorschau
+        # erst für die Top-N bauen (vgl. wendepunkt_kandidaten in
+        # Modul A) — verworfene Kandidaten kosten weder f-Strings noch
+        # Text-Slices. heapq.nlargest hält nur n Kandidaten statt alle zu
+        # sortieren (O(T·log n) statt O(T·log T)); Gleichstand behält
+        # die Turn-Reihenfolge.
+        gescort = []
         for row in summary:
             if row['n_marker'] == 0:
                 continue
-            
-            score = 0
+            dichte = row['marker_dichte']
+            nda = row['n_dimensionen_aktiv']
+            dims = row['dimensionen']
+            score = (
+                (3 if dichte > 5 else 1 if dichte > 2 else 0)
+                + (3 if nda >= 3 else 1 if nda >= 2 else 0)
+                + 2 * ('AMBIVALENZ' in dims)
+                + 2 * ('KOERPERLICHER_VERWEIS' in dims)
+                + ('DISTANZIERUNG' in dims)
+            )
+            gescort.append((score, row))
+
+        top = heapq.nlargest(n, gescort, key=lambda x: x[0])
+        turns = {t.turn_id: t for t in document.get_befragte_turns()}
+
+        kandidaten = []
+        for score, row in top:
+            dichte = row['marker_dichte']
+            nda = row['n_dimensionen_aktiv']
+            dims = row['dimensionen']
             reasons = []
-            
+
             # Marker-Dichte
-            if row['marker_dichte'] > 5:
-                score += 3
-                reasons.append(f"Hohe Marker-Dichte: {row['marker_dichte']}%")
-            elif row['marker_dichte'] > 2:
-                score += 1
-                reasons.append(f"Mittlere Marker-Dichte: {row['marker_dichte']}%")
-            
+            if dichte > 5:
+                reasons.append(f"Hohe Marker-Dichte: {dichte}%")
+            elif dichte > 2:
+                reasons.append(f"Mittlere Marker-Dichte: {dichte}%")
+
             # Mehrere Dimensionen gleichzeitig
-            if row['n_dimensionen_aktiv'] >= 3:
-                score += 3
-                reasons.append(f"Multidimensional: {row['n_dimensionen_aktiv']} Dimensionen aktiv")
-            elif row['n_dimensionen_aktiv'] >= 2:
-                score += 1
-                reasons.append(f"{row['n_dimensionen_aktiv']} Dimensionen aktiv")
-            
+            if nda >= 3:
+                reasons.append(f"Multidimensional: {nda} Dimensionen aktiv")
+            elif nda >= 2:
+                reasons.append(f"{nda} Dimensionen aktiv")
+
             # Ambivalenz als besonderer Marker
-            if 'AMBIVALENZ' in row['dimensionen']:
-                score += 2
-                reasons.append(f"Ambivalenz erkannt ({row['dimensionen']['AMBIVALENZ']}x)")
-            
+            if 'AMBIVALENZ' in dims:
+                reasons.append(f"Ambivalenz erkannt ({dims['AMBIVALENZ']}x)")
+
             # Körperlicher Verweis
-            if 'KOERPERLICHER_VERWEIS' in row['dimensionen']:
-                score += 2
-                reasons.append(f"Körperlicher Ausdruck ({row['dimensionen']['KOERPERLICHER_VERWEIS']}x)")
-            
+            if 'KOERPERLICHER_VERWEIS' in dims:
+                reasons.append(f"Körperlicher Ausdruck ({dims['KOERPERLICHER_VERWEIS']}x)")
+
             # Distanzierung (Signal für schwieriges Thema)
-            if 'DISTANZIERUNG' in row['dimensionen']:
-                score += 1
-                reasons.append(f"Distanzierungsmarker ({row['dimensionen']['DISTANZIERUNG']}x)")
-            
+            if 'DISTANZIERUNG' in dims:
+                reasons.append(f"Distanzierungsmarker ({dims['DISTANZIERUNG']}x)")
+
             turn = turns.get(row['turn_id'])
             text = turn.text if turn else ""
-            
+
             kandidaten.append({
                 'turn_id': row['turn_id'],
                 'score': score,
                 'reasons': reasons,
-                'marker_dichte': row['marker_dichte'],
+                'marker_dichte': dichte,
                 'n_marker': row['n_marker'],
-                'dimensionen': row['dimensionen'],
+                'dimensionen': dims,
                 'text_vorschau': text[:200] + '...' if len(text) > 200 else text,
             })
-        
-        kandidaten.sort(key=lambda x: -x['score'])
-        return kandidaten[:n]
+
+        return kandidaten